@@ -5,6 +5,8 @@
 
 from datetime import datetime
 from datetime import timedelta
+from functools import lru_cache
+from operator import attrgetter
 import re
 from typing import Final, TYPE_CHECKING
 
@@ -22,6 +24,78 @@ if TYPE_CHECKING:
 
 
 _MIN_COMMITS_FOR_WEEKLY_DIFF: Final[int] = 2
+_ESCAPED_CHAR: Final[re.Pattern[str]] = re.compile(r"\\(.)")
+
+
+def _as_literal(pattern: str) -> str | None:
+    """Returns the plain text a regex matches if it contains no regex syntax.
+
+    Args:
+        pattern: A regular expression, e.g. ``docs/`` or an escaped ``.md`` suffix.
+
+    Returns:
+        The unescaped text, or None if the pattern uses any regex feature.
+    """
+    literal = _ESCAPED_CHAR.sub(r"\1", pattern)
+    return literal if re.escape(literal) == pattern else None
+
+
+@lru_cache(maxsize=32)
+def _split_trivial_file_patterns(
+    patterns: tuple[str, ...],
+) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...], tuple[re.Pattern[str], ...]]:
+    """Sorts file patterns into plain string checks and regexes that still need compiling.
+
+    Literal patterns anchored with ``$`` or ``^``, or not anchored at all, become
+    ``endswith``/``startswith``/``in`` checks, which avoid the regex engine. The remaining
+    patterns are joined into one alternation when none of them has capturing groups, whose
+    numbering would shift once combined. Results are memoized, so analyzers built from the
+    same configuration share one split instead of re-parsing and re-compiling it.
+
+    Args:
+        patterns: The configured trivial file patterns.
+
+    Returns:
+        A tuple of (suffixes, prefixes, substrings, compiled fallback regexes).
+
+    Raises:
+        re.error: If a pattern is not a valid regular expression.
+    """
+    suffixes: list[str] = []
+    prefixes: list[str] = []
+    substrings: list[str] = []
+    regexes: list[re.Pattern[str]] = []
+    for pattern in patterns:
+        if pattern.endswith("$") and (literal := _as_literal(pattern[:-1])) is not None:
+            suffixes.append(literal)
+        elif pattern.startswith("^") and (literal := _as_literal(pattern[1:])) is not None:
+            prefixes.append(literal)
+        elif (literal := _as_literal(pattern)) is not None:
+            substrings.append(literal)
+        else:
+            regexes.append(re.compile(pattern))
+    if len(regexes) > 1 and not any(regex.groups for regex in regexes):
+        try:
+            regexes = [re.compile("|".join(f"(?:{regex.pattern})" for regex in regexes))]
+        except re.error:
+            pass  # e.g. inline global flags, which are only valid at the start of a pattern
+    return tuple(suffixes), tuple(prefixes), tuple(substrings), tuple(regexes)
+
+
+@lru_cache(maxsize=32)
+def _compile_trivial_message_re(commit_types: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Builds one case-insensitive regex matching ``type:`` or ``type(`` message prefixes.
+
+    Args:
+        commit_types: The configured trivial commit types.
+
+    Returns:
+        The compiled alternation, or None when no types are configured.
+    """
+    if not commit_types:
+        return None
+    alternation = "|".join(re.escape(commit_type) for commit_type in commit_types)
+    return re.compile(rf"(?:{alternation})[:(]", re.IGNORECASE)
 
 
 class GitAnalyzerConfig(BaseModel):
@@ -45,7 +119,21 @@ class GitAnalyzer:
         """
         self.repo = repo
         self._trivial_commit_types = config.trivial_commit_types
-        self._trivial_file_patterns = config.trivial_file_patterns
+        self._trivial_message_re = _compile_trivial_message_re(tuple(config.trivial_commit_types))
+        # Raw (bytes) commit messages are matched as-is rather than decoded first. Case folding
+        # on bytes is ASCII-only, and undecodable bytes are not skipped the way decoding with
+        # errors="ignore" skipped them, so a message starting with one is not trivial.
+        self._trivial_message_re_bytes = (
+            re.compile(self._trivial_message_re.pattern.encode("utf-8"), re.IGNORECASE)
+            if self._trivial_message_re is not None
+            else None
+        )
+        (
+            self._trivial_suffixes,
+            self._trivial_prefixes,
+            self._trivial_substrings,
+            self._trivial_file_patterns,
+        ) = _split_trivial_file_patterns(tuple(config.trivial_file_patterns))
         self._git_command_timeout = config.git_command_timeout
         self._debug = config.debug
 
@@ -68,7 +156,9 @@ class GitAnalyzer:
                     "--all", after=start_date.isoformat(), before=end_date_inclusive.isoformat()
                 )
             )
-            return sorted(commits, key=lambda c: c.committed_datetime)
+            # Sort on the raw epoch seconds: committed_datetime builds a new tz-aware
+            # datetime on every access, which the ordering does not need.
+            return sorted(commits, key=attrgetter("committed_date"))
         except GitCommandError:
             return []
 
@@ -81,14 +171,11 @@ class GitAnalyzer:
         Returns:
             True if the commit message starts with a defined triviality prefix.
         """
-        message = commit.message
-        if isinstance(message, bytes):
-            message = message.decode("utf-8", "ignore")
-        msg_lower = message.lower()
-        return any(
-            msg_lower.startswith(f"{trivial_type}:") or msg_lower.startswith(f"{trivial_type}(")
-            for trivial_type in self._trivial_commit_types
-        )
+        if self._trivial_message_re is None or self._trivial_message_re_bytes is None:
+            return False
+        if isinstance(message := commit.message, bytes):
+            return self._trivial_message_re_bytes.match(message) is not None
+        return self._trivial_message_re.match(message) is not None
 
     def _is_trivial_by_file_paths(self, diffs: DiffIndex[Diff]) -> bool:
         """Checks if all files in a diff match trivial patterns.
@@ -103,7 +190,12 @@ class GitAnalyzer:
             if not (path := diff_item.a_path or diff_item.b_path):
                 return False  # Should not happen, but not trivial
 
-            if not any(re.search(pattern, path) for pattern in self._trivial_file_patterns):
+            if not (
+                path.endswith(self._trivial_suffixes)
+                or path.startswith(self._trivial_prefixes)
+                or any(substring in path for substring in self._trivial_substrings)
+                or any(pattern.search(path) for pattern in self._trivial_file_patterns)
+            ):
                 return False  # Found one non-trivial file
         return True  # All files were trivial
 
@@ -116,16 +208,20 @@ class GitAnalyzer:
         Returns:
             The raw diff text as a string.
         """
-        command_args = (
-            ["show", commit.hexsha]
-            if not commit.parents
-            else ["diff", commit.parents[0].hexsha, commit.hexsha]
-        )
-
         try:
+            if commit.parents:
+                # Served by a long-running `git diff-tree --stdin` process shared per repo.
+                return git_command_runner.fetch_commit_diff(
+                    str(self.repo.working_dir),
+                    commit.parents[0].hexsha,
+                    commit.hexsha,
+                    timeout=self._git_command_timeout,
+                    debug=self._debug,
+                )
             return git_command_runner.run_git_command(
                 str(self.repo.working_dir),
-                *command_args,
+                "show",
+                commit.hexsha,
                 timeout=self._git_command_timeout,
                 debug=self._debug,
             )
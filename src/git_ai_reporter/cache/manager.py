@@ -3,15 +3,18 @@
 
 """This module handles caching of analysis results to the filesystem."""
 
+import asyncio
 from datetime import date
 import hashlib
 import json
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import aiofiles
 import aiofiles.os
 from pydantic import ValidationError
+import pydantic_core
 
 from ..models import CommitAnalysis
 from ..utils import json_helpers
@@ -20,6 +23,26 @@ if TYPE_CHECKING:
     from ..models import AnalysisResult
 
 
+def _write_files(batch: list[tuple[Path, bytes]]) -> list[OSError | None]:
+    """Writes a batch of cache files, collecting each file's error instead of stopping.
+
+    Args:
+        batch: (path, content) pairs, with content already encoded as UTF-8.
+
+    Returns:
+        The OSError raised for each file, or None where the write succeeded.
+    """
+    errors: list[OSError | None] = []
+    for path, content in batch:
+        try:
+            path.write_bytes(content)
+        except OSError as e:
+            errors.append(e)
+        else:
+            errors.append(None)
+    return errors
+
+
 class CacheManager:
     """Manages reading from and writing to the file-based cache."""
 
@@ -36,6 +59,10 @@ class CacheManager:
         self._narratives_path = self.cache_path / "narratives"
         self._changelogs_path = self.cache_path / "changelogs"
 
+        # Names of the files known to be in each cache directory: listed once here, then kept
+        # current by our own writes and by lookups. An entry missing from the index is still
+        # checked on disk, so files another process or CacheManager writes later are found.
+        self._present: dict[Path, set[str]] = {}
         for path in (
             self._commits_path,
             self._daily_summaries_path,
@@ -43,7 +70,82 @@ class CacheManager:
             self._narratives_path,
             self._changelogs_path,
         ):
-            path.mkdir(parents=True, exist_ok=True)
+            # One listing per directory; only a missing directory costs an extra mkdir.
+            try:
+                with os.scandir(path) as entries:
+                    self._present[path] = {entry.name for entry in entries}
+            except FileNotFoundError:
+                path.mkdir(parents=True, exist_ok=True)
+                self._present[path] = set()
+
+        # Writes issued in the same event-loop iteration share one worker-thread hop.
+        self._write_batch: list[tuple[Path, bytes]] | None = None
+        self._write_batch_task: asyncio.Task[list[OSError | None]] | None = None
+
+    async def _write_bytes(self, path: Path, content: bytes) -> None:
+        """Writes a cache file, batched with any other writes issued concurrently.
+
+        Returns once this file is on disk, so a following read always sees it.
+
+        Args:
+            path: The cache file to write.
+            content: The UTF-8 encoded content to write.
+
+        Raises:
+            OSError: If this file could not be written.
+        """
+        if self._write_batch is None or self._write_batch_task is None:
+            self._write_batch = []
+            self._write_batch_task = asyncio.create_task(self._flush_write_batch())
+        index = len(self._write_batch)
+        self._write_batch.append((path, content))
+        # Shield the shared flush so cancelling one writer does not cancel the others.
+        if (error := (await asyncio.shield(self._write_batch_task))[index]) is not None:
+            raise error
+        self._present.setdefault(path.parent, set()).add(path.name)
+
+    async def _is_cached(self, cache_file: Path) -> bool:
+        """Checks whether a cache file exists, consulting the in-memory index first.
+
+        Args:
+            cache_file: The cache file to look up.
+
+        Returns:
+            True if the file is indexed or, failing that, exists on disk.
+        """
+        if cache_file.name in self._present.get(cache_file.parent, ()):
+            return True
+        if await aiofiles.os.path.isfile(cache_file):
+            self._present.setdefault(cache_file.parent, set()).add(cache_file.name)
+            return True
+        return False
+
+    async def _read_cached_text(self, cache_file: Path) -> str | None:
+        """Reads a cached text file, or returns None if it is not in the cache.
+
+        Args:
+            cache_file: The cache file to read.
+
+        Returns:
+            The file content, or None if the file is not cached or was removed since.
+        """
+        if not await self._is_cached(cache_file):
+            return None
+        try:
+            async with aiofiles.open(cache_file, "r", encoding="utf-8") as f:
+                return await f.read()
+        except FileNotFoundError:
+            self._present[cache_file.parent].discard(cache_file.name)
+            return None
+
+    async def _flush_write_batch(self) -> list[OSError | None]:
+        """Waits one loop iteration for writers to join the batch, then writes it in a thread."""
+        try:
+            await asyncio.sleep(0)
+        finally:
+            batch = self._write_batch or []
+            self._write_batch = self._write_batch_task = None
+        return await asyncio.to_thread(_write_files, batch)
 
     async def get_commit_analysis(self, hexsha: str) -> CommitAnalysis | None:
         """Retrieves a cached commit analysis.
@@ -55,12 +157,22 @@ class CacheManager:
             A CommitAnalysis object or None if not found in cache.
         """
         cache_file = self._commits_path / f"{hexsha}.json"
-        if await aiofiles.os.path.exists(cache_file):
+        if await self._is_cached(cache_file):
             try:
-                async with aiofiles.open(cache_file, "r", encoding="utf-8") as f:
-                    content = await f.read()
-                data = json_helpers.safe_json_decode(content)
+                # Open, read and close in one worker-thread hop rather than one hop per call.
+                if not (content := await asyncio.to_thread(cache_file.read_bytes)):
+                    return None  # An empty entry, e.g. from an interrupted write.
+                try:
+                    # pydantic-core parses and validates the raw bytes in one native pass.
+                    return CommitAnalysis.model_validate_json(content)
+                except ValidationError as e:
+                    if e.errors()[0]["type"] != "json_invalid":
+                        raise
+                # Not strict JSON (e.g. edited by hand), so retry with the tolerant parser.
+                data = json_helpers.safe_json_decode(content.decode("utf-8", errors="replace"))
                 return CommitAnalysis.model_validate(data)
+            except FileNotFoundError:
+                self._present[self._commits_path].discard(cache_file.name)
             except (json.JSONDecodeError, ValidationError):
                 # If the file is corrupted or the schema is wrong, treat as a cache miss.
                 return None
@@ -74,8 +186,7 @@ class CacheManager:
             analysis: The CommitAnalysis object to save.
         """
         cache_file = self._commits_path / f"{hexsha}.json"
-        async with aiofiles.open(cache_file, "w", encoding="utf-8") as f:
-            await f.write(analysis.model_dump_json(indent=2))
+        await self._write_bytes(cache_file, pydantic_core.to_json(analysis))
 
     def _get_hash(self, items: list[str]) -> str:
         """Creates a stable hash from a list of strings."""
@@ -105,6 +216,7 @@ class CacheManager:
         self._commits_path.mkdir(parents=True, exist_ok=True)
         cache_file = self._commits_path / f"{key}.json"
         cache_file.write_text(data.model_dump_json(indent=2), encoding="utf-8")
+        self._present[self._commits_path].add(cache_file.name)
 
     def load(self, key: str, data_type: type[CommitAnalysis]) -> CommitAnalysis | None:
         """Load data from cache with the given key.
@@ -139,10 +251,7 @@ class CacheManager:
         """
         content_hash = self._get_hash(commit_hexshas)
         cache_file = self._daily_summaries_path / f"{commit_date.isoformat()}-{content_hash}.txt"
-        if await aiofiles.os.path.exists(cache_file):
-            async with aiofiles.open(cache_file, "r", encoding="utf-8") as f:
-                return await f.read()
-        return None
+        return await self._read_cached_text(cache_file)
 
     async def set_daily_summary(
         self, commit_date: date, commit_hexshas: list[str], summary: str
@@ -156,8 +265,7 @@ class CacheManager:
         """
         content_hash = self._get_hash(commit_hexshas)
         cache_file = self._daily_summaries_path / f"{commit_date.isoformat()}-{content_hash}.txt"
-        async with aiofiles.open(cache_file, "w", encoding="utf-8") as f:
-            await f.write(summary)
+        await self._write_bytes(cache_file, summary.encode())
 
     async def get_weekly_summary(self, week_num_str: str, commit_hexshas: list[str]) -> str | None:
         """Retrieves a cached weekly summary.
@@ -171,10 +279,7 @@ class CacheManager:
         """
         content_hash = self._get_hash(commit_hexshas)
         cache_file = self._weekly_summaries_path / f"{week_num_str}-{content_hash}.txt"
-        if await aiofiles.os.path.exists(cache_file):
-            async with aiofiles.open(cache_file, "r", encoding="utf-8") as f:
-                return await f.read()
-        return None
+        return await self._read_cached_text(cache_file)
 
     async def set_weekly_summary(
         self, week_num_str: str, commit_hexshas: list[str], summary: str
@@ -188,8 +293,7 @@ class CacheManager:
         """
         content_hash = self._get_hash(commit_hexshas)
         cache_file = self._weekly_summaries_path / f"{week_num_str}-{content_hash}.txt"
-        async with aiofiles.open(cache_file, "w", encoding="utf-8") as f:
-            await f.write(summary)
+        await self._write_bytes(cache_file, summary.encode())
 
     async def get_final_narrative(self, result: "AnalysisResult") -> str | None:
         """Retrieves a cached final narrative.
@@ -211,10 +315,7 @@ class CacheManager:
         ]
         content_hash = self._get_hash(hashes)
         cache_file = self._narratives_path / f"{content_hash}.txt"
-        if await aiofiles.os.path.exists(cache_file):
-            async with aiofiles.open(cache_file, "r", encoding="utf-8") as f:
-                return await f.read()
-        return None
+        return await self._read_cached_text(cache_file)
 
     async def set_final_narrative(self, result: "AnalysisResult", narrative: str) -> None:
         """Saves a final narrative to the cache.
@@ -234,8 +335,7 @@ class CacheManager:
         ]
         content_hash = self._get_hash(hashes)
         cache_file = self._narratives_path / f"{content_hash}.txt"
-        async with aiofiles.open(cache_file, "w", encoding="utf-8") as f:
-            await f.write(narrative)
+        await self._write_bytes(cache_file, narrative.encode())
 
     async def get_changelog_entries(self, entries: list[CommitAnalysis]) -> str | None:
         """Retrieves cached changelog entries.
@@ -251,10 +351,7 @@ class CacheManager:
         ]
         content_hash = self._get_hash(hashes)
         cache_file = self._changelogs_path / f"{content_hash}.txt"
-        if await aiofiles.os.path.exists(cache_file):
-            async with aiofiles.open(cache_file, "r", encoding="utf-8") as f:
-                return await f.read()
-        return None
+        return await self._read_cached_text(cache_file)
 
     async def set_changelog_entries(self, entries: list[CommitAnalysis], changelog: str) -> None:
         """Saves changelog entries to the cache.
@@ -268,5 +365,4 @@ class CacheManager:
         ]
         content_hash = self._get_hash(hashes)
         cache_file = self._changelogs_path / f"{content_hash}.txt"
-        async with aiofiles.open(cache_file, "w", encoding="utf-8") as f:
-            await f.write(changelog)
+        await self._write_bytes(cache_file, changelog.encode())
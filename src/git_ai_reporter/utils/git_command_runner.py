@@ -3,10 +3,19 @@
 
 """A robust, async-native utility for running git commands as subprocesses."""
 
+import atexit
+import os
 import subprocess  # nosec B404
+import threading
+import time
+from typing import IO, Final
 
 from rich import print as rprint
 
+# Echoed back verbatim by `git diff-tree --stdin` because it is not an object name, so it
+# marks the end of each diff on the shared stdout pipe.
+_DIFF_END_MARKER: Final[str] = "git-ai-reporter:end-of-diff"
+
 
 class GitCommandError(Exception):
     """Custom exception for errors during git command execution."""
@@ -65,3 +74,305 @@ def run_git_command(repo_path: str, *args: str, timeout: int, debug: bool = Fals
         ) from e
     except OSError as e:
         raise GitCommandError(f"Failed to execute git command: {e}") from e
+
+
+class GitDiffTreeBatch:
+    """A long-running `git diff-tree -p --stdin` process that serves many diffs.
+
+    Each request writes a `<commit> <parent>` line followed by an end marker, so one
+    subprocess is reused instead of forking `git diff` once per commit. Under git's
+    default configuration the output is the same patch text that `git diff <parent>
+    <commit>` produces. As a plumbing command, diff-tree ignores the porcelain `diff.*`
+    settings and textconv drivers that `git diff` applies, so the two can differ in
+    repositories that configure them.
+    """
+
+    def __init__(self, repo_path: str):
+        """Initializes the batch runner without starting the subprocess.
+
+        Args:
+            repo_path: The path to the repository.
+        """
+        self._repo_path = repo_path
+        self._command = [
+            "git",
+            "-C",
+            repo_path,
+            "diff-tree",
+            "-p",
+            "-M",
+            "--no-commit-id",
+            "--stdin",
+        ]
+        self._process: subprocess.Popen[str] | None = None
+        self._stderr_lines: list[str] = []
+        self._stderr_thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        # One watchdog thread per subprocess kills it once the current request's deadline
+        # passes; _watchdog guards the deadline, the timeout flag and _process changes.
+        self._watchdog = threading.Condition()
+        self._watchdog_thread: threading.Thread | None = None
+        self._deadline: float | None = None
+        self._timed_out = False
+
+    def _start(self, debug: bool) -> subprocess.Popen[str]:
+        """Starts the subprocess if it is not already running.
+
+        Args:
+            debug: If True, print the command when a new subprocess is started.
+
+        Returns:
+            The running subprocess.
+
+        Raises:
+            GitCommandError: If the subprocess cannot be started.
+        """
+        if self._process is not None:
+            if self._process.poll() is None:
+                return self._process
+            self.close()  # Reap the dead process and close its pipes before respawning.
+        if debug:
+            rprint(f"[bold cyan]Starting Git Batch Command:[/] {' '.join(self._command)}")
+        try:
+            process = subprocess.Popen(  # nosec B603
+                self._command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                errors="ignore",
+            )
+        except OSError as e:
+            raise GitCommandError(f"Failed to execute git command: {e}") from e
+        # Drain stderr in the background so a chatty git can never block on a full pipe.
+        self._stderr_lines = []
+        self._stderr_thread = threading.Thread(
+            target=self._drain, args=(process.stderr, self._stderr_lines), daemon=True
+        )
+        self._stderr_thread.start()
+        with self._watchdog:
+            self._process = process
+            self._deadline = None
+            self._timed_out = False
+        self._watchdog_thread = threading.Thread(target=self._watch, args=(process,), daemon=True)
+        self._watchdog_thread.start()
+        return process
+
+    def _watch(self, process: subprocess.Popen[str]) -> None:
+        """Kills the subprocess whenever a request outlives its deadline.
+
+        Runs for the lifetime of the subprocess, so requests only set and clear a deadline
+        instead of each starting a timer thread.
+
+        Args:
+            process: The subprocess to watch; the thread exits once it is replaced or closed.
+        """
+        with self._watchdog:
+            while self._process is process:
+                if self._deadline is None:
+                    self._watchdog.wait()
+                elif (remaining := self._deadline - time.monotonic()) > 0:
+                    self._watchdog.wait(remaining)
+                else:
+                    # A hung git process is killed, which ends the pending read with EOF.
+                    self._deadline = None
+                    self._timed_out = True
+                    process.kill()
+
+    @staticmethod
+    def _drain(stream: IO[str] | None, lines: list[str]) -> None:
+        """Collects every line of a stream until it is closed."""
+        if stream is not None:
+            lines.extend(stream)
+
+    def fetch(self, parent_sha: str, commit_sha: str, *, timeout: int, debug: bool = False) -> str:
+        """Returns the diff between a commit and one of its parents.
+
+        Args:
+            parent_sha: The SHA of the parent commit to diff against.
+            commit_sha: The SHA of the commit.
+            timeout: The timeout in seconds for this single diff.
+            debug: If True, print any git command this request starts.
+
+        Returns:
+            The raw diff text as a string.
+
+        Raises:
+            GitCommandError: If git reports an error, the subprocess dies or times out,
+                or it cannot be started.
+        """
+        with self._lock:
+            process = self._start(debug)
+            if (stdin := process.stdin) is None or (stdout := process.stdout) is None:
+                raise GitCommandError("Git diff-tree process has no stdio pipes")
+            with self._watchdog:
+                self._deadline = time.monotonic() + timeout
+                self._watchdog.notify()
+            try:
+                stdin.write(f"{commit_sha} {parent_sha}\n{_DIFF_END_MARKER}\n")
+                stdin.flush()
+                diff = self._read_until_marker(stdout)
+            except OSError:
+                diff = None  # The process died before taking the request.
+            finally:
+                with self._watchdog:
+                    self._deadline = None
+                    timed_out = self._timed_out
+            if diff is None:
+                raise self._failure(commit_sha, timeout, timed_out=timed_out)
+        if not diff:
+            # diff-tree skips objects it cannot read without printing anything, even on
+            # stderr, so an empty diff is confirmed by `git diff`, which reports bad objects.
+            return run_git_command(
+                self._repo_path,
+                "diff",
+                parent_sha,
+                commit_sha,
+                timeout=timeout,
+                debug=debug,
+            )
+        return diff
+
+    @staticmethod
+    def _read_until_marker(stdout: IO[str]) -> str | None:
+        """Reads one diff from the subprocess output.
+
+        Args:
+            stdout: The subprocess stdout pipe.
+
+        Returns:
+            The diff text preceding the end marker, or None if the output ended first.
+        """
+        lines: list[str] = []
+        marker_line = f"{_DIFF_END_MARKER}\n"
+        while line := stdout.readline():
+            if line == marker_line:
+                return "".join(lines)
+            lines.append(line)
+        return None
+
+    def _failure(self, commit_sha: str, timeout: int, *, timed_out: bool) -> GitCommandError:
+        """Stops the subprocess and describes why a request could not be answered.
+
+        Args:
+            commit_sha: The SHA being diffed, used in the message.
+            timeout: The timeout in seconds, used in the message.
+            timed_out: Whether the watchdog killed the subprocess.
+
+        Returns:
+            The error to raise, carrying git's own message when it exited on its own.
+        """
+        process, stderr_lines = self._process, self._stderr_lines
+        self.close()
+        if timed_out:
+            return GitCommandError(
+                f"Git diff-tree timed out after {timeout} seconds while diffing {commit_sha}"
+            )
+        returncode = process.returncode if process is not None else None
+        return GitCommandError(
+            f"Git diff-tree failed with exit code {returncode} while diffing {commit_sha}: "
+            f"{''.join(stderr_lines).strip()}"
+        )
+
+    def close(self) -> None:
+        """Stops the subprocess, if running, and closes its pipes."""
+        with self._watchdog:
+            if (process := self._process) is None:
+                return
+            self._process = None
+            self._watchdog.notify()  # Lets the watchdog thread see it is done and exit.
+        if process.stdin is not None:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        if process.stdout is not None:
+            process.stdout.close()
+        if self._watchdog_thread is not None:
+            self._watchdog_thread.join(timeout=5)
+            self._watchdog_thread = None
+        # The drain thread ends at EOF, which the exited process has now produced.
+        if self._stderr_thread is not None:
+            self._stderr_thread.join(timeout=5)
+            self._stderr_thread = None
+        if process.stderr is not None:
+            process.stderr.close()
+
+
+# Idle batch processes per repository path. A caller checks one out for the duration of a
+# fetch, so concurrent threads each get their own process instead of queueing on one.
+_diff_batches: dict[str, list[GitDiffTreeBatch]] = {}
+# Batch processes per repository path, idle or checked out, bounded by _max_diff_batches().
+_diff_batch_counts: dict[str, int] = {}
+_diff_batches_lock = threading.Lock()
+
+
+def _max_diff_batches() -> int:
+    """Returns how many diff-tree processes one repository may keep: 3/4 of the CPUs."""
+    return max(1, (os.cpu_count() or 1) * 3 // 4)
+
+
+def fetch_commit_diff(
+    repo_path: str,
+    parent_sha: str,
+    commit_sha: str,
+    *,
+    timeout: int,
+    debug: bool = False,
+) -> str:
+    """Get a commit's diff against a parent through a shared `GitDiffTreeBatch`.
+
+    Batch processes are pooled per repository path: sequential calls reuse one process,
+    and each concurrent caller gets its own, up to `_max_diff_batches()`. Callers beyond
+    that limit run a one-off `git diff` rather than starting another persistent process.
+
+    Args:
+        repo_path: The path to the repository.
+        parent_sha: The SHA of the parent commit to diff against.
+        commit_sha: The SHA of the commit.
+        timeout: The timeout in seconds for this single diff.
+        debug: If True, print each requested diff range.
+
+    Returns:
+        The raw diff text as a string.
+
+    Raises:
+        GitCommandError: If the diff cannot be produced.
+    """
+    batch: GitDiffTreeBatch | None = None
+    with _diff_batches_lock:
+        if idle := _diff_batches.get(repo_path):
+            batch = idle.pop()
+        elif (count := _diff_batch_counts.get(repo_path, 0)) < _max_diff_batches():
+            batch = GitDiffTreeBatch(repo_path)
+            _diff_batch_counts[repo_path] = count + 1
+    if debug:
+        rprint(f"[bold cyan]Fetching Git Diff:[/] {parent_sha[:7]}..{commit_sha[:7]}")
+    if batch is None:
+        return run_git_command(
+            repo_path, "diff", parent_sha, commit_sha, timeout=timeout, debug=debug
+        )
+    try:
+        return batch.fetch(parent_sha, commit_sha, timeout=timeout, debug=debug)
+    finally:
+        with _diff_batches_lock:
+            _diff_batches.setdefault(repo_path, []).append(batch)
+
+
+@atexit.register
+def close_diff_batches() -> None:
+    """Stop every batch process started by `fetch_commit_diff`."""
+    with _diff_batches_lock:
+        batches = [batch for idle in _diff_batches.values() for batch in idle]
+        for repo_path, idle in _diff_batches.items():
+            # Batches still checked out keep their slot until they are returned.
+            _diff_batch_counts[repo_path] -= len(idle)
+        _diff_batches.clear()
+    for batch in batches:
+        batch.close()
@@ -6,6 +6,7 @@
 This file contains fixtures and configuration that are available to all tests.
 """
 
+from collections.abc import Callable
 from collections.abc import Iterator
 from datetime import datetime
 import json
@@ -18,6 +19,7 @@ from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import Mock
 
+import allure
 import git
 import pytest
 
@@ -33,6 +35,7 @@ pytest_plugins = ["tests.allure_unified_plugin"]
 
 # Constants
 WINDOWS_OS_NAME: Final[str] = "nt"
+SHM_DIR: Final[Path] = Path("/dev/shm")
 
 
 # pylint: disable=wrong-import-position
@@ -59,6 +62,25 @@ def temp_dir() -> Iterator[Path]:
         safe_cleanup_on_windows(temp_path)
 
 
+@pytest.fixture(scope="class")
+def memory_temp_dir() -> Iterator[Path]:
+    """Create a temporary directory on tmpfs (/dev/shm) when one is writable.
+
+    I/O-heavy tests use this so their writes stay in the page cache. Falls back to the
+    default temporary directory elsewhere (e.g. macOS and Windows). The directory is shared
+    by every test in a class, so tests must namespace what they write.
+
+    Yields:
+        Path: Path to the temporary directory.
+    """
+    base = SHM_DIR if SHM_DIR.is_dir() and os.access(SHM_DIR, os.W_OK) else None
+    temp_path = Path(tempfile.mkdtemp(dir=base))
+    try:
+        yield temp_path
+    finally:
+        safe_cleanup_on_windows(temp_path)
+
+
 @pytest.fixture
 def temp_git_repo(temp_dir: Path) -> Iterator[git.Repo]:  # pylint: disable=redefined-outer-name
     """Create a temporary git repository for testing.
@@ -295,6 +317,42 @@ def vcr_config_session() -> dict[str, Any]:
     }
 
 
+@pytest.fixture(scope="session")
+def attach_if_verbose() -> Callable[..., None]:
+    """Provide ``allure.attach`` only when ``ALLURE_VERBOSE`` is set in the environment.
+
+    Informational attachments bloat the report of a default run, so tests call this
+    instead of ``allure.attach`` and get a no-op unless verbose reports are requested.
+
+    Returns:
+        Callable[..., None]: ``allure.attach`` or a no-op with the same signature.
+    """
+    if os.environ.get("ALLURE_VERBOSE"):
+        return allure.attach
+
+    def _skip_attach(*_args: object, **_kwargs: object) -> None:
+        return None
+
+    return _skip_attach
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _pydantic_warmup() -> None:
+    """Exercise the core models once so no single test pays their first-use cost.
+
+    The first validation and JSON round trip of a Pydantic model is noticeably slower than
+    later ones; doing it here keeps that cost out of whichever test happens to run first.
+    """
+    result = AnalysisResult(
+        period_summaries=[],
+        daily_summaries=[],
+        changelog_entries=[
+            CommitAnalysis(changes=[Change(summary="", category="Chore")], trivial=False)
+        ],
+    )
+    AnalysisResult.model_validate_json(result.model_dump_json())
+
+
 def pytest_configure(config: pytest.Config) -> None:
     """Configure pytest with custom markers.
 
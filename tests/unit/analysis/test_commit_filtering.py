@@ -11,6 +11,7 @@ import pytest
 
 from git_ai_reporter.analysis.git_analyzer import GitAnalyzer
 from git_ai_reporter.analysis.git_analyzer import GitAnalyzerConfig
+from tests.utils.git_mocks import COMMIT_SPEC
 
 
 @allure.feature("Git Analysis")
@@ -38,7 +39,7 @@ class TestCommitFiltering:
     @allure.description("Verify that test commits are processed as important work")
     def test_test_commits_not_trivial(self, git_analyzer: GitAnalyzer) -> None:
         """Test that commits with 'test:' prefix are not marked as trivial."""
-        mock_commit = MagicMock(spec=git.Commit)
+        mock_commit = MagicMock(spec=COMMIT_SPEC)
         mock_commit.message = "test: Add comprehensive unit tests for authentication"
 
         result = git_analyzer._is_trivial_by_message(mock_commit)
@@ -48,7 +49,7 @@ class TestCommitFiltering:
     @allure.description("Verify that refactoring commits are processed as important work")
     def test_refactor_commits_not_trivial(self, git_analyzer: GitAnalyzer) -> None:
         """Test that commits with 'refactor:' prefix are not marked as trivial."""
-        mock_commit = MagicMock(spec=git.Commit)
+        mock_commit = MagicMock(spec=COMMIT_SPEC)
         mock_commit.message = "refactor: Improve database query performance"
 
         result = git_analyzer._is_trivial_by_message(mock_commit)
@@ -58,7 +59,7 @@ class TestCommitFiltering:
     @allure.description("Verify that CI/CD commits are processed as important infrastructure work")
     def test_ci_commits_not_trivial(self, git_analyzer: GitAnalyzer) -> None:
         """Test that commits with 'ci:' prefix are not marked as trivial."""
-        mock_commit = MagicMock(spec=git.Commit)
+        mock_commit = MagicMock(spec=COMMIT_SPEC)
         mock_commit.message = "ci: Add GitHub Actions workflow for automated testing"
 
         result = git_analyzer._is_trivial_by_message(mock_commit)
@@ -68,7 +69,7 @@ class TestCommitFiltering:
     @allure.description("Verify that documentation commits are processed as important work")
     def test_docs_commits_not_trivial(self, git_analyzer: GitAnalyzer) -> None:
         """Test that commits with 'docs:' prefix are not marked as trivial."""
-        mock_commit = MagicMock(spec=git.Commit)
+        mock_commit = MagicMock(spec=COMMIT_SPEC)
         mock_commit.message = "docs: Update API documentation with new endpoints"
 
         result = git_analyzer._is_trivial_by_message(mock_commit)
@@ -78,7 +79,7 @@ class TestCommitFiltering:
     @allure.description("Verify that pure formatting commits are still filtered")
     def test_style_commits_are_trivial(self, git_analyzer: GitAnalyzer) -> None:
         """Test that commits with 'style:' prefix are still marked as trivial."""
-        mock_commit = MagicMock(spec=git.Commit)
+        mock_commit = MagicMock(spec=COMMIT_SPEC)
         mock_commit.message = "style: Format code with prettier"
 
         result = git_analyzer._is_trivial_by_message(mock_commit)
@@ -88,7 +89,7 @@ class TestCommitFiltering:
     @allure.description("Verify that routine chore commits are still filtered")
     def test_chore_commits_are_trivial(self, git_analyzer: GitAnalyzer) -> None:
         """Test that commits with 'chore:' prefix are marked as trivial."""
-        mock_commit = MagicMock(spec=git.Commit)
+        mock_commit = MagicMock(spec=COMMIT_SPEC)
         mock_commit.message = "chore: Update .gitignore"
 
         result = git_analyzer._is_trivial_by_message(mock_commit)
@@ -98,7 +99,7 @@ class TestCommitFiltering:
     @allure.description("Verify that feature commits are always processed")
     def test_feat_commits_not_trivial(self, git_analyzer: GitAnalyzer) -> None:
         """Test that commits with 'feat:' prefix are not marked as trivial."""
-        mock_commit = MagicMock(spec=git.Commit)
+        mock_commit = MagicMock(spec=COMMIT_SPEC)
         mock_commit.message = "feat: Add user authentication system"
 
         result = git_analyzer._is_trivial_by_message(mock_commit)
@@ -108,7 +109,7 @@ class TestCommitFiltering:
     @allure.description("Verify that bug fix commits are always processed")
     def test_fix_commits_not_trivial(self, git_analyzer: GitAnalyzer) -> None:
         """Test that commits with 'fix:' prefix are not marked as trivial."""
-        mock_commit = MagicMock(spec=git.Commit)
+        mock_commit = MagicMock(spec=COMMIT_SPEC)
         mock_commit.message = "fix: Resolve memory leak in image processing"
 
         result = git_analyzer._is_trivial_by_message(mock_commit)
@@ -178,7 +179,7 @@ class TestCommitFiltering:
     @allure.description("Verify that performance optimization commits are processed")
     def test_perf_commits_not_trivial(self, git_analyzer: GitAnalyzer) -> None:
         """Test that commits with 'perf:' prefix are not marked as trivial."""
-        mock_commit = MagicMock(spec=git.Commit)
+        mock_commit = MagicMock(spec=COMMIT_SPEC)
         mock_commit.message = "perf: Optimize database query performance"
 
         result = git_analyzer._is_trivial_by_message(mock_commit)
@@ -188,7 +189,7 @@ class TestCommitFiltering:
     @allure.description("Verify that build system commits are processed")
     def test_build_commits_not_trivial(self, git_analyzer: GitAnalyzer) -> None:
         """Test that commits with 'build:' prefix are not marked as trivial."""
-        mock_commit = MagicMock(spec=git.Commit)
+        mock_commit = MagicMock(spec=COMMIT_SPEC)
         mock_commit.message = "build: Update dependencies to latest versions"
 
         result = git_analyzer._is_trivial_by_message(mock_commit)
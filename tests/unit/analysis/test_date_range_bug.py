@@ -11,6 +11,7 @@ import pytest
 
 from git_ai_reporter.analysis.git_analyzer import GitAnalyzer
 from git_ai_reporter.analysis.git_analyzer import GitAnalyzerConfig
+from tests.utils.git_mocks import COMMIT_SPEC
 
 # Test constants
 EXPECTED_COMMIT_COUNT_WITH_END_DATE = 4
@@ -40,35 +41,40 @@ class TestDateRangeBug:
         repo = MagicMock(spec=git.Repo)
 
         # Create mock commits with specific timestamps
-        commit1 = MagicMock(spec=git.Commit)
+        commit1 = MagicMock(spec=COMMIT_SPEC)
         commit1.hexsha = "abc123"
         commit1.message = "feat: First feature on Aug 23 morning"
         # August 23, 2025 at 10:00 AM
         commit1.committed_datetime = datetime(2025, 8, 23, 10, 0, 0)
+        commit1.committed_date = int(commit1.committed_datetime.timestamp())
 
-        commit2 = MagicMock(spec=git.Commit)
+        commit2 = MagicMock(spec=COMMIT_SPEC)
         commit2.hexsha = "def456"
         commit2.message = "fix: Bug fix on Aug 23 afternoon"
         # August 23, 2025 at 3:00 PM
         commit2.committed_datetime = datetime(2025, 8, 23, 15, 0, 0)
+        commit2.committed_date = int(commit2.committed_datetime.timestamp())
 
-        commit3 = MagicMock(spec=git.Commit)
+        commit3 = MagicMock(spec=COMMIT_SPEC)
         commit3.hexsha = "ghi789"
         commit3.message = "feat: Important feature on Aug 23 late evening"
         # August 23, 2025 at 10:48 PM (like the Allure commit)
         commit3.committed_datetime = datetime(2025, 8, 23, 22, 48, 0)
+        commit3.committed_date = int(commit3.committed_datetime.timestamp())
 
-        commit4 = MagicMock(spec=git.Commit)
+        commit4 = MagicMock(spec=COMMIT_SPEC)
         commit4.hexsha = "jkl012"
         commit4.message = "test: Test added on Aug 24 morning"
         # August 24, 2025 at 9:00 AM
         commit4.committed_datetime = datetime(2025, 8, 24, 9, 0, 0)
+        commit4.committed_date = int(commit4.committed_datetime.timestamp())
 
-        commit5 = MagicMock(spec=git.Commit)
+        commit5 = MagicMock(spec=COMMIT_SPEC)
         commit5.hexsha = "mno345"
         commit5.message = "docs: Documentation on Aug 25"
         # August 25, 2025 at 11:00 AM (should not be included)
         commit5.committed_datetime = datetime(2025, 8, 25, 11, 0, 0)
+        commit5.committed_date = int(commit5.committed_datetime.timestamp())
 
         return repo, [commit1, commit2, commit3, commit4, commit5]
 
@@ -201,17 +207,19 @@ class TestDateRangeBug:
         repo = MagicMock(spec=git.Repo)
 
         # Create the actual Allure commit
-        allure_commit = MagicMock(spec=git.Commit)
+        allure_commit = MagicMock(spec=COMMIT_SPEC)
         allure_commit.hexsha = "7702d0b"
         allure_commit.message = "feat: add comprehensive Allure test reporting infrastructure"
         # Exact timestamp from the real commit
         allure_commit.committed_datetime = datetime(2025, 8, 23, 22, 48, 47)
+        allure_commit.committed_date = int(allure_commit.committed_datetime.timestamp())
 
         # Create another commit from earlier that day
-        earlier_commit = MagicMock(spec=git.Commit)
+        earlier_commit = MagicMock(spec=COMMIT_SPEC)
         earlier_commit.hexsha = "9b0b8f7"
         earlier_commit.message = "fix: modernize build commands and resolve CodeQL issues"
         earlier_commit.committed_datetime = datetime(2025, 8, 23, 14, 30, 0)
+        earlier_commit.committed_date = int(earlier_commit.committed_datetime.timestamp())
 
         all_commits = [earlier_commit, allure_commit]
 
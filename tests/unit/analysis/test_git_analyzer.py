@@ -7,14 +7,21 @@
 This module tests the GitAnalyzer class which handles all interactions
 with Git repositories including commit filtering, diff generation, and
 analysis of changes.
+
+Safe for pytest-xdist (``-n auto``): the module-level commits and dates are
+never mutated, ``mock_runner`` is function-scoped, and the module-scoped
+``mock_repo`` is reset after every test.
 """
 
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from dataclasses import field
 from datetime import datetime
 from datetime import timedelta
 import json
-import time
 from unittest.mock import MagicMock
-from unittest.mock import Mock
 from unittest.mock import patch
 
 import allure
@@ -28,23 +35,73 @@ from git_ai_reporter.analysis.git_analyzer import GitAnalyzerConfig
 from git_ai_reporter.utils.git_command_runner import GitCommandError as CommandRunnerError
 
 
-@pytest.fixture
+@dataclass(slots=True)
+class FakeCommit:
+    """Lightweight stand-in for ``git.Commit`` carrying only what GitAnalyzer reads."""
+
+    hexsha: str = ""
+    parents: list["FakeCommit"] = field(default_factory=list)
+    message: str | bytes = ""
+    committed_datetime: datetime | None = None
+    committed_date: int = 0
+
+    def __post_init__(self) -> None:
+        """Derive the epoch seconds GitPython exposes alongside ``committed_datetime``."""
+        if self.committed_datetime is not None and not self.committed_date:
+            self.committed_date = int(self.committed_datetime.timestamp())
+
+
+@dataclass(slots=True)
+class FakeDiff:
+    """Lightweight stand-in for ``git.diff.Diff`` carrying only the changed paths."""
+
+    a_path: str | None = None
+    b_path: str | None = None
+
+
+_COMMIT1 = FakeCommit("commit1", [FakeCommit("parent1")])
+_COMMIT2 = FakeCommit("commit2", [_COMMIT1])
+_COMMIT3 = FakeCommit("commit3", [_COMMIT2])
+_ROOT_COMMIT = FakeCommit("root")
+
+# Single-file diffs checked against the analyzer_config patterns, built once at import.
+FILE_PATTERN_CASES = [
+    pytest.param(FakeDiff(a_path=path), expected, id=path)
+    for path, expected in (
+        ("README.md", True),
+        ("docs/guide.md", True),
+        ("src/README.md", True),
+        ("test.txt", True),
+        ("src/main.py", False),
+        ("tests/test_foo.py", False),
+        ("docs/api.py", True),  # Matches docs/ pattern
+    )
+]
+
+RANGE_START = datetime(2025, 1, 1)
+RANGE_END = datetime(2025, 1, 8)
+RANGE_START_ISO = RANGE_START.isoformat()
+# get_commits_in_range makes the end date inclusive by querying up to the next midnight.
+RANGE_BEFORE_ISO = (RANGE_END + timedelta(days=1)).isoformat()
+
+
+@pytest.fixture(scope="module")
 @allure.title("Mock Git repository fixture")
-def mock_repo() -> MagicMock:
+def mock_repo(attach_if_verbose: Callable[..., None]) -> MagicMock:
     """Create a mock Git repository."""
     with allure.step("Create mock Git repository for testing"):
         repo = MagicMock(spec=git.Repo)
         repo.working_dir = "/mock/repo"
         repo.iter_commits = MagicMock()
 
-        allure.attach(
+        attach_if_verbose(
             json.dumps(
                 {
                     "working_directory": "/mock/repo",
                     "mock_type": "git.Repo",
                     "iter_commits_available": True,
                 },
-                indent=2,
+                separators=(",", ":"),
             ),
             name="Mock Repository Configuration",
             attachment_type=allure.attachment_type.JSON,
@@ -52,9 +109,9 @@ def mock_repo() -> MagicMock:
         return repo
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 @allure.title("Git analyzer configuration fixture")
-def analyzer_config() -> GitAnalyzerConfig:
+def analyzer_config(attach_if_verbose: Callable[..., None]) -> GitAnalyzerConfig:
     """Create a GitAnalyzerConfig for testing."""
     with allure.step("Create git analyzer configuration"):
         config = GitAnalyzerConfig(
@@ -64,7 +121,7 @@ def analyzer_config() -> GitAnalyzerConfig:
             debug=False,
         )
 
-        allure.attach(
+        attach_if_verbose(
             json.dumps(
                 {
                     "trivial_commit_types": config.trivial_commit_types,
@@ -72,7 +129,7 @@ def analyzer_config() -> GitAnalyzerConfig:
                     "git_command_timeout": config.git_command_timeout,
                     "debug_enabled": config.debug,
                 },
-                indent=2,
+                separators=(",", ":"),
             ),
             name="Analyzer Configuration",
             attachment_type=allure.attachment_type.JSON,
@@ -80,7 +137,7 @@ def analyzer_config() -> GitAnalyzerConfig:
         return config
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def git_analyzer(
     mock_repo: MagicMock,  # pylint: disable=redefined-outer-name
     analyzer_config: GitAnalyzerConfig,  # pylint: disable=redefined-outer-name
@@ -89,15 +146,50 @@ def git_analyzer(
     return GitAnalyzer(repo=mock_repo, config=analyzer_config)
 
 
+@pytest.fixture(autouse=True)
+def reset_mock_repo(
+    mock_repo: MagicMock,  # pylint: disable=redefined-outer-name
+) -> Iterator[None]:
+    """Clear the shared repository mock's calls and configured results after each test."""
+    yield
+    mock_repo.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
+def debug_config(
+    analyzer_config: GitAnalyzerConfig,  # pylint: disable=redefined-outer-name
+) -> GitAnalyzerConfig:
+    """Create the debug-mode variant of the shared analyzer configuration."""
+    return analyzer_config.model_copy(update={"debug": True})
+
+
+@pytest.fixture(scope="module")
+def debug_analyzer(
+    mock_repo: MagicMock,  # pylint: disable=redefined-outer-name
+    debug_config: GitAnalyzerConfig,  # pylint: disable=redefined-outer-name
+) -> GitAnalyzer:
+    """Create a GitAnalyzer that re-raises git command errors."""
+    return GitAnalyzer(repo=mock_repo, config=debug_config)
+
+
+@pytest.fixture(autouse=True)
+def mock_runner() -> Iterator[MagicMock]:
+    """Patch the git command runner, keeping its real error type for except clauses."""
+    with patch("git_ai_reporter.analysis.git_analyzer.git_command_runner") as runner:
+        runner.GitCommandError = CommandRunnerError
+        runner.run_git_command.return_value = ""
+        runner.fetch_commit_diff.return_value = ""
+        yield runner
+
+
 @pytest.fixture
-def mock_commit() -> MagicMock:
+def mock_commit() -> FakeCommit:
     """Create a mock commit object."""
-    commit = MagicMock(spec=git.Commit)
-    commit.hexsha = "abc123def456"
-    commit.message = "feat: Add new feature"
-    commit.committed_datetime = datetime(2025, 1, 7, 10, 0, 0)
-    commit.parents = []
-    return commit
+    return FakeCommit(
+        "abc123def456",
+        message="feat: Add new feature",
+        committed_datetime=datetime(2025, 1, 7, 10, 0, 0),
+    )
 
 
 @allure.feature("Analysis - Git Analyzer")
@@ -105,6 +197,19 @@ def mock_commit() -> MagicMock:
 class TestGitAnalyzer:
     """Test suite for GitAnalyzer class."""
 
+    def _expect(self, runner: MagicMock, *args: str, method: str = "run_git_command") -> None:
+        """Assert the patched runner was called once with the default repo/timeout/debug."""
+        getattr(runner, method).assert_called_once_with(
+            "/mock/repo", *args, timeout=300, debug=False
+        )
+
+    def _raises(
+        self, runner: MagicMock
+    ) -> AbstractContextManager[pytest.ExceptionInfo[CommandRunnerError]]:
+        """Make the patched runner fail and return a context expecting that failure."""
+        runner.run_git_command.side_effect = CommandRunnerError("Error")
+        return pytest.raises(CommandRunnerError)
+
     @pytest.mark.smoke
     @allure.title("Initialize GitAnalyzer with configuration")
     @allure.description(
@@ -121,6 +226,7 @@ class TestGitAnalyzer:
         self,
         mock_repo: MagicMock,  # pylint: disable=redefined-outer-name
         analyzer_config: GitAnalyzerConfig,  # pylint: disable=redefined-outer-name
+        attach_if_verbose: Callable[..., None],
     ) -> None:
         """Test GitAnalyzer initialization."""
         allure.dynamic.description(
@@ -128,52 +234,33 @@ class TestGitAnalyzer:
         )
         allure.dynamic.tag("dependency-injection")
 
-        start_time = time.time()
-
         with allure.step("Create GitAnalyzer instance"):
-            try:
-                analyzer = GitAnalyzer(repo=mock_repo, config=analyzer_config)
-                init_time = time.time() - start_time
-
-                allure.attach(
-                    json.dumps(
-                        {
-                            "initialization_time_ms": init_time * 1000,
-                            "repo_working_dir": analyzer.repo.working_dir,
-                            "config_applied": True,
-                        },
-                        indent=2,
-                    ),
-                    name="Initialization Performance",
-                    attachment_type=allure.attachment_type.JSON,
-                )
-            except Exception as e:
-                allure.attach(
-                    f"Initialization failed: {str(e)}",
-                    name="Initialization Error",
-                    attachment_type=allure.attachment_type.TEXT,
-                )
-                raise
+            analyzer = GitAnalyzer(repo=mock_repo, config=analyzer_config)
 
         with allure.step("Verify analyzer initialization and configuration"):
             check.equal(analyzer.repo, mock_repo)
             check.equal(
                 analyzer._trivial_commit_types, ["chore", "docs", "style"]
             )  # pylint: disable=protected-access
-            check.equal(len(analyzer._trivial_file_patterns), 3)  # pylint: disable=protected-access
+            # pylint: disable=protected-access
+            check.equal(analyzer._trivial_suffixes, (".md", ".txt"))
+            check.equal(analyzer._trivial_substrings, ("docs/",))
+            check.equal(analyzer._trivial_file_patterns, ())
+            # pylint: enable=protected-access
             check.equal(analyzer._git_command_timeout, 300)  # pylint: disable=protected-access
             check.is_false(analyzer._debug)  # pylint: disable=protected-access
 
-            allure.attach(
+            attach_if_verbose(
                 json.dumps(
                     {
                         "repo_match": analyzer.repo == mock_repo,
                         "trivial_types_count": len(analyzer._trivial_commit_types),
-                        "pattern_count": len(analyzer._trivial_file_patterns),
+                        "pattern_count": len(analyzer._trivial_suffixes)
+                        + len(analyzer._trivial_substrings),
                         "timeout_seconds": analyzer._git_command_timeout,
                         "debug_disabled": not analyzer._debug,
                     },
-                    indent=2,
+                    separators=(",", ":"),
                 ),
                 name="Configuration Verification",
                 attachment_type=allure.attachment_type.JSON,
@@ -194,20 +281,14 @@ class TestGitAnalyzer:
         """Test fetching commits within a date range."""
         with allure.step("Setup mock commits with different dates"):
             # Setup mock commits
-            commit1 = MagicMock()
-        commit1.committed_datetime = datetime(2025, 1, 5, 10, 0, 0)
-        commit2 = MagicMock()
-        commit2.committed_datetime = datetime(2025, 1, 7, 10, 0, 0)
-        commit3 = MagicMock()
-        commit3.committed_datetime = datetime(2025, 1, 6, 10, 0, 0)
+            commit1 = FakeCommit(committed_datetime=datetime(2025, 1, 5, 10, 0, 0))
+            commit2 = FakeCommit(committed_datetime=datetime(2025, 1, 7, 10, 0, 0))
+            commit3 = FakeCommit(committed_datetime=datetime(2025, 1, 6, 10, 0, 0))
 
         mock_repo.iter_commits.return_value = [commit1, commit2, commit3]
 
         with allure.step("Execute commit range query"):
-            # Call method
-            start_date = datetime(2025, 1, 1)
-            end_date = datetime(2025, 1, 8)
-            commits = git_analyzer.get_commits_in_range(start_date, end_date)
+            commits = git_analyzer.get_commits_in_range(RANGE_START, RANGE_END)
 
         with allure.step("Verify commit retrieval and sorting"):
             # Verify
@@ -218,9 +299,7 @@ class TestGitAnalyzer:
         check.equal(commits[2].committed_datetime, datetime(2025, 1, 7, 10, 0, 0))
         # Verify that end_date is made inclusive by adding 1 day
         mock_repo.iter_commits.assert_called_once_with(
-            "--all",
-            after=start_date.isoformat(),
-            before=(end_date + timedelta(days=1)).isoformat(),
+            "--all", after=RANGE_START_ISO, before=RANGE_BEFORE_ISO
         )
 
     @allure.title("Handle Git command errors when fetching commits")
@@ -237,13 +316,10 @@ class TestGitAnalyzer:
             mock_repo.iter_commits.side_effect = GitCommandError("git", "error")
 
         with allure.step("Execute commit range query with error"):
-            commits = git_analyzer.get_commits_in_range(
-                datetime(2025, 1, 1),
-                datetime(2025, 1, 8),
-            )
+            commits = git_analyzer.get_commits_in_range(RANGE_START, RANGE_END)
 
         with allure.step("Verify error handled gracefully"):
-            check.equal(commits, [])
+            assert commits == []
 
     @allure.title("Detect commit triviality by message prefix")
     @allure.description(
@@ -251,41 +327,27 @@ class TestGitAnalyzer:
     )
     @allure.severity(allure.severity_level.NORMAL)
     @allure.tag("git", "triviality", "commit-messages")
+    @pytest.mark.parametrize(
+        ("message", "expected_trivial"),
+        [
+            ("chore: Update dependencies", True),
+            ("docs: Fix typo", True),
+            ("style(frontend): Format code", True),
+            ("Chore: Capitalized type", True),
+            ("chores: Not a configured type", False),
+            ("feat: Add new feature", False),
+            ("fix: Resolve bug", False),
+        ],
+    )
     def test_is_trivial_by_message(
         self,
         git_analyzer: GitAnalyzer,  # pylint: disable=redefined-outer-name
+        message: str,
+        expected_trivial: bool,
     ) -> None:
         """Test commit triviality detection by message."""
-        with allure.step("Test trivial commit detection"):
-            # Trivial commits
-            trivial_commit = MagicMock()
-        trivial_commit.message = "chore: Update dependencies"
-        check.is_true(
-            git_analyzer._is_trivial_by_message(trivial_commit)
-        )  # pylint: disable=protected-access
-
-        trivial_commit.message = "docs: Fix typo"
-        check.is_true(
-            git_analyzer._is_trivial_by_message(trivial_commit)
-        )  # pylint: disable=protected-access
-
-        trivial_commit.message = "style(frontend): Format code"
-        check.is_true(
-            git_analyzer._is_trivial_by_message(trivial_commit)
-        )  # pylint: disable=protected-access
-
-        with allure.step("Test non-trivial commit detection"):
-            # Non-trivial commits
-            non_trivial = MagicMock()
-        non_trivial.message = "feat: Add new feature"
-        check.is_false(
-            git_analyzer._is_trivial_by_message(non_trivial)
-        )  # pylint: disable=protected-access
-
-        non_trivial.message = "fix: Resolve bug"
-        check.is_false(
-            git_analyzer._is_trivial_by_message(non_trivial)
-        )  # pylint: disable=protected-access
+        commit = FakeCommit(message=message)
+        assert git_analyzer._is_trivial_by_message(commit) is expected_trivial  # type: ignore[arg-type]
 
     @allure.title("Handle byte string commit messages")
     @allure.description(
@@ -293,19 +355,26 @@ class TestGitAnalyzer:
     )
     @allure.severity(allure.severity_level.MINOR)
     @allure.tag("git", "encoding", "bytes")
+    @pytest.mark.parametrize(
+        ("message", "expected_trivial"),
+        [
+            (b"chore: Update dependencies", True),
+            (b"Docs(api): Fix typo", True),
+            (b"style: \xff undecodable byte", True),
+            # Bytes are not decoded, so a leading undecodable byte is not skipped.
+            (b"\xffchore: Leading undecodable byte", False),
+            (b"feat: Add new feature", False),
+        ],
+    )
     def test_is_trivial_by_message_bytes(
         self,
         git_analyzer: GitAnalyzer,  # pylint: disable=redefined-outer-name
+        message: bytes,
+        expected_trivial: bool,
     ) -> None:
-        """Test handling of byte string commit messages."""
-        with allure.step("Test byte string commit message decoding"):
-            commit = MagicMock()
-            commit.message = b"chore: Update dependencies"
-
-        with allure.step("Verify byte string message classified correctly"):
-            check.is_true(
-                git_analyzer._is_trivial_by_message(commit)
-            )  # pylint: disable=protected-access
+        """Test that byte string commit messages are classified without decoding."""
+        commit = FakeCommit(message=message)
+        assert git_analyzer._is_trivial_by_message(commit) is expected_trivial  # type: ignore[arg-type]
 
     @allure.title("Detect commit triviality by file paths")
     @allure.description(
@@ -320,42 +389,22 @@ class TestGitAnalyzer:
         """Test file path triviality detection."""
         with allure.step("Test all trivial files detection"):
             # All trivial files
-            diff1 = MagicMock()
-        diff1.a_path = "README.md"
-        diff1.b_path = None
-
-        diff2 = MagicMock()
-        diff2.a_path = None
-        diff2.b_path = "docs/guide.md"
+            diff1 = FakeDiff(a_path="README.md")
+            diff2 = FakeDiff(b_path="docs/guide.md")
 
-        diffs = MagicMock()
-        diffs.__iter__ = Mock(return_value=iter([diff1, diff2]))
-
-        check.is_true(
-            git_analyzer._is_trivial_by_file_paths(diffs)
-        )  # pylint: disable=protected-access
+        assert git_analyzer._is_trivial_by_file_paths([diff1, diff2])  # type: ignore[arg-type]
 
         with allure.step("Test mixed trivial and non-trivial files"):
             # Mix of trivial and non-trivial
-            diff3 = MagicMock()
-        diff3.a_path = "src/main.py"
-        diff3.b_path = None
+            diff3 = FakeDiff(a_path="src/main.py")
 
-        diffs.__iter__ = Mock(return_value=iter([diff1, diff3]))
-        check.is_false(
-            git_analyzer._is_trivial_by_file_paths(diffs)
-        )  # pylint: disable=protected-access
+        assert not git_analyzer._is_trivial_by_file_paths([diff1, diff3])  # type: ignore[arg-type]
 
         with allure.step("Test edge case with no paths"):
             # No path (edge case)
-            diff4 = MagicMock()
-        diff4.a_path = None
-        diff4.b_path = None
+            diff4 = FakeDiff()
 
-        diffs.__iter__ = Mock(return_value=iter([diff4]))
-        check.is_false(
-            git_analyzer._is_trivial_by_file_paths(diffs)
-        )  # pylint: disable=protected-access
+        assert not git_analyzer._is_trivial_by_file_paths([diff4])  # type: ignore[arg-type]
 
     @allure.title("Generate commit diff output")
     @allure.description(
@@ -363,47 +412,33 @@ class TestGitAnalyzer:
     )
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.tag("git", "diff", "commits")
-    @patch("git_ai_reporter.analysis.git_analyzer.git_command_runner")
     def test_get_commit_diff(
         self,
-        mock_runner: MagicMock,
+        mock_runner: MagicMock,  # pylint: disable=redefined-outer-name
         git_analyzer: GitAnalyzer,  # pylint: disable=redefined-outer-name
-        mock_commit: MagicMock,  # pylint: disable=redefined-outer-name
+        mock_commit: FakeCommit,  # pylint: disable=redefined-outer-name
     ) -> None:
         """Test getting diff for a single commit."""
         with allure.step("Test initial commit diff (no parents)"):
             # Test with no parents (initial commit)
             mock_runner.run_git_command.return_value = "diff content"
 
-            diff = git_analyzer.get_commit_diff(mock_commit)
+            diff = git_analyzer.get_commit_diff(mock_commit)  # type: ignore[arg-type]
 
-        check.equal(diff, "diff content")
-        mock_runner.run_git_command.assert_called_once_with(
-            "/mock/repo",
-            "show",
-            "abc123def456",
-            timeout=300,
-            debug=False,
-        )
+        assert diff == "diff content"
+        self._expect(mock_runner, "show", "abc123def456")
 
         with allure.step("Test commit diff with parent"):
             # Test with parent
-            mock_runner.reset_mock()
-            parent = MagicMock()
-            parent.hexsha = "parent123"
-            mock_commit.parents = [parent]
-
-            diff = git_analyzer.get_commit_diff(mock_commit)
-
-        check.equal(diff, "diff content")
-        mock_runner.run_git_command.assert_called_once_with(
-            "/mock/repo",
-            "diff",
-            "parent123",
-            "abc123def456",
-            timeout=300,
-            debug=False,
-        )
+            mock_runner.run_git_command.reset_mock()
+            mock_runner.fetch_commit_diff.return_value = "batched diff"
+            mock_commit.parents = [FakeCommit("parent123")]
+
+            diff = git_analyzer.get_commit_diff(mock_commit)  # type: ignore[arg-type]
+
+        assert diff == "batched diff"
+        self._expect(mock_runner, "parent123", "abc123def456", method="fetch_commit_diff")
+        mock_runner.run_git_command.assert_not_called()
 
     @allure.title("Handle errors in commit diff generation")
     @allure.description(
@@ -411,210 +446,108 @@ class TestGitAnalyzer:
     )
     @allure.severity(allure.severity_level.NORMAL)
     @allure.tag("git", "error-handling", "diff")
-    @patch("git_ai_reporter.analysis.git_analyzer.git_command_runner")
     def test_get_commit_diff_error(
         self,
-        mock_runner: MagicMock,
+        mock_runner: MagicMock,  # pylint: disable=redefined-outer-name
         git_analyzer: GitAnalyzer,  # pylint: disable=redefined-outer-name
-        mock_commit: MagicMock,  # pylint: disable=redefined-outer-name
+        mock_commit: FakeCommit,  # pylint: disable=redefined-outer-name
     ) -> None:
         """Test error handling in get_commit_diff."""
         with allure.step("Setup Git command error"):
             mock_runner.run_git_command.side_effect = CommandRunnerError("Error")
-            mock_runner.GitCommandError = CommandRunnerError
 
         with allure.step("Execute diff generation with error"):
-            diff = git_analyzer.get_commit_diff(mock_commit)
+            diff = git_analyzer.get_commit_diff(mock_commit)  # type: ignore[arg-type]
 
         with allure.step("Verify error handled gracefully"):
-            check.equal(diff, "")
+            assert diff == ""
 
-    @patch("git_ai_reporter.analysis.git_analyzer.git_command_runner")
-    def test_get_weekly_diff_error_debug_mode(
+    def test_get_commit_diff_with_parent_error(
         self,
-        mock_runner: MagicMock,
-        mock_repo: MagicMock,  # pylint: disable=redefined-outer-name
-        mock_commit: MagicMock,  # pylint: disable=redefined-outer-name
-    ) -> None:
-        """Test error handling in get_weekly_diff with debug mode."""
-        config = GitAnalyzerConfig(
-            trivial_commit_types=["chore", "docs"],
-            trivial_file_patterns=[r".*\.md$"],
-            git_command_timeout=300,
-            debug=True,  # Enable debug mode
-        )
-        analyzer = GitAnalyzer(mock_repo, config)
-
-        # Setup commits with parent
-        parent = MagicMock()
-        parent.hexsha = "parent123"
-        mock_commit.parents = [parent]
-        second_commit = MagicMock()
-        second_commit.hexsha = "def456ghi789"
-
-        mock_runner.run_git_command.side_effect = CommandRunnerError("Git error")
-        mock_runner.GitCommandError = CommandRunnerError
-
-        # Should raise the error in debug mode
-        with pytest.raises(CommandRunnerError):
-            analyzer.get_weekly_diff([mock_commit, second_commit])
-
-        # Test with debug mode
-        analyzer._debug = True  # pylint: disable=protected-access
-        with pytest.raises(CommandRunnerError):
-            analyzer.get_commit_diff(mock_commit)
-
-    @patch("git_ai_reporter.analysis.git_analyzer.git_command_runner")
-    def test_get_weekly_diff(
-        self,
-        mock_runner: MagicMock,
+        mock_runner: MagicMock,  # pylint: disable=redefined-outer-name
         git_analyzer: GitAnalyzer,  # pylint: disable=redefined-outer-name
     ) -> None:
-        """Test getting consolidated weekly diff."""
-        # Create mock commits
-        commit1 = MagicMock()
-        commit1.hexsha = "commit1"
-        parent1 = MagicMock()
-        parent1.hexsha = "parent1"
-        commit1.parents = [parent1]
-
-        commit2 = MagicMock()
-        commit2.hexsha = "commit2"
-        commit2.parents = [commit1]
-
-        commit3 = MagicMock()
-        commit3.hexsha = "commit3"
-        commit3.parents = [commit2]
-
-        mock_runner.run_git_command.return_value = "weekly diff"
-
-        # Test with multiple commits
-        diff = git_analyzer.get_weekly_diff([commit1, commit2, commit3])
-
-        check.equal(diff, "weekly diff")
-        mock_runner.run_git_command.assert_called_once_with(
-            "/mock/repo",
-            "diff",
-            "parent1",
-            "commit3",
-            timeout=300,
-            debug=False,
-        )
+        """Test that batch diff failures are swallowed outside debug mode."""
+        mock_runner.fetch_commit_diff.side_effect = CommandRunnerError("Error")
 
-    @patch("git_ai_reporter.analysis.git_analyzer.git_command_runner")
-    def test_get_weekly_diff_single_commit(
-        self,
-        mock_runner: MagicMock,
-        git_analyzer: GitAnalyzer,  # pylint: disable=redefined-outer-name
-        mock_commit: MagicMock,  # pylint: disable=redefined-outer-name
-    ) -> None:
-        """Test weekly diff with single commit."""
-        mock_runner.run_git_command.return_value = "single diff"
-
-        # Test with single commit
-        diff = git_analyzer.get_weekly_diff([mock_commit])
-
-        check.equal(diff, "single diff")
-        mock_runner.run_git_command.assert_called_once_with(
-            "/mock/repo",
-            "show",
-            "abc123def456",
-            timeout=300,
-            debug=False,
-        )
+        assert git_analyzer.get_commit_diff(_COMMIT2) == ""  # type: ignore[arg-type]
 
-    @patch("git_ai_reporter.analysis.git_analyzer.git_command_runner")
-    def test_get_weekly_diff_empty(
+    def test_get_commit_diff_debug_mode(
         self,
-        mock_runner: MagicMock,  # pylint: disable=unused-argument
-        git_analyzer: GitAnalyzer,  # pylint: disable=redefined-outer-name
+        mock_runner: MagicMock,  # pylint: disable=redefined-outer-name
+        debug_analyzer: GitAnalyzer,  # pylint: disable=redefined-outer-name
+        mock_commit: FakeCommit,  # pylint: disable=redefined-outer-name
     ) -> None:
-        """Test weekly diff with no commits."""
-        diff = git_analyzer.get_weekly_diff([])
-        check.equal(diff, "")
-
-    @patch("git_ai_reporter.analysis.git_analyzer.git_command_runner")
-    def test_get_weekly_diff_root_commit(
+        """Test that get_commit_diff re-raises runner errors in debug mode."""
+        with self._raises(mock_runner):
+            debug_analyzer.get_commit_diff(mock_commit)  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize(
+        ("commits", "method", "expected_args"),
+        [
+            pytest.param(
+                [_COMMIT1, _COMMIT2, _COMMIT3],
+                "run_git_command",
+                ("diff", "parent1", "commit3"),
+                id="multiple-commits",
+            ),
+            pytest.param(
+                [FakeCommit("abc123def456")],
+                "run_git_command",
+                ("show", "abc123def456"),
+                id="single-commit",
+            ),
+            pytest.param([], "run_git_command", None, id="empty"),
+            pytest.param(
+                [_ROOT_COMMIT, FakeCommit("last", [_ROOT_COMMIT])],
+                "fetch_commit_diff",
+                ("root", "last"),
+                id="root-commit",
+            ),
+        ],
+    )
+    def test_get_weekly_diff(
         self,
-        mock_runner: MagicMock,
+        mock_runner: MagicMock,  # pylint: disable=redefined-outer-name
         git_analyzer: GitAnalyzer,  # pylint: disable=redefined-outer-name
+        commits: list[FakeCommit],
+        method: str,
+        expected_args: tuple[str, ...] | None,
     ) -> None:
-        """Test weekly diff when first commit is root."""
-        # Root commit (no parents)
-        root_commit = MagicMock()
-        root_commit.hexsha = "root"
-        root_commit.parents = []
-
-        last_commit = MagicMock()
-        last_commit.hexsha = "last"
-        last_commit.parents = [root_commit]
-
-        mock_runner.run_git_command.return_value = "root diff"
-
-        diff = git_analyzer.get_weekly_diff([root_commit, last_commit])
-
-        check.equal(diff, "root diff")
-        # Should use diff between root and last
-        mock_runner.run_git_command.assert_called_with(
-            "/mock/repo",
-            "diff",
-            "root",
-            "last",
-            timeout=300,
-            debug=False,
-        )
-
-    @patch("git_ai_reporter.analysis.git_analyzer.git_command_runner")
-    def test_get_weekly_diff_error_handling_debug_mode(
-        self,
-        mock_runner: MagicMock,
-        mock_repo: MagicMock,  # pylint: disable=redefined-outer-name
-    ) -> None:
-        """Test error handling in get_weekly_diff with debug mode."""
-        # Create analyzer with debug=True
-        config = GitAnalyzerConfig(
-            trivial_commit_types=["chore", "docs"],
-            trivial_file_patterns=[r"\.md$"],
-            git_command_timeout=300,
-            debug=True,
-        )
-        analyzer = GitAnalyzer(mock_repo, config)
-
-        commit1 = MagicMock()
-        commit1.hexsha = "commit1"
-        parent1 = MagicMock()
-        parent1.hexsha = "parent1"
-        commit1.parents = [parent1]
-
-        # Set up the error
-        mock_runner.run_git_command.side_effect = CommandRunnerError("Error")
-        mock_runner.GitCommandError = CommandRunnerError
-
-        # Should re-raise in debug mode
-        with pytest.raises(CommandRunnerError):
-            analyzer.get_weekly_diff([commit1])
-
-    @patch("git_ai_reporter.analysis.git_analyzer.git_command_runner")
+        """Test consolidated weekly diff for multiple, single, empty and root-commit weeks."""
+        getattr(mock_runner, method).return_value = "weekly diff"
+
+        diff = git_analyzer.get_weekly_diff(commits)  # type: ignore[arg-type]
+
+        if expected_args is None:
+            assert diff == ""
+            mock_runner.run_git_command.assert_not_called()
+            mock_runner.fetch_commit_diff.assert_not_called()
+        else:
+            assert diff == "weekly diff"
+            self._expect(mock_runner, *expected_args, method=method)
+
+    @pytest.mark.parametrize(
+        ("analyzer_name", "expect_raise"),
+        [("git_analyzer", False), ("debug_analyzer", True)],
+    )
     def test_get_weekly_diff_error_handling(
         self,
-        mock_runner: MagicMock,
-        git_analyzer: GitAnalyzer,  # pylint: disable=redefined-outer-name
+        request: pytest.FixtureRequest,
+        mock_runner: MagicMock,  # pylint: disable=redefined-outer-name
+        analyzer_name: str,
+        expect_raise: bool,
     ) -> None:
-        """Test error handling in get_weekly_diff."""
-        commit1 = MagicMock()
-        commit1.hexsha = "commit1"
-        parent1 = MagicMock()
-        parent1.hexsha = "parent1"
-        commit1.parents = [parent1]
-
-        commit2 = MagicMock()
-        commit2.hexsha = "commit2"
-
-        mock_runner.run_git_command.side_effect = CommandRunnerError("Error")
-        mock_runner.GitCommandError = CommandRunnerError
-
-        diff = git_analyzer.get_weekly_diff([commit1, commit2])
-        check.equal(diff, "")
+        """Test that get_weekly_diff swallows runner errors, re-raising only in debug mode."""
+        analyzer: GitAnalyzer = request.getfixturevalue(analyzer_name)
+        commits = [_COMMIT1, _COMMIT2]
+
+        if expect_raise:
+            with self._raises(mock_runner):
+                analyzer.get_weekly_diff(commits)  # type: ignore[arg-type]
+        else:
+            mock_runner.run_git_command.side_effect = CommandRunnerError("Error")
+            assert analyzer.get_weekly_diff(commits) == ""  # type: ignore[arg-type]
 
     def test_config_validation(self) -> None:
         """Test GitAnalyzerConfig validation."""
@@ -651,49 +584,55 @@ class TestGitAnalyzer:
         analyzer = GitAnalyzer(repo=mock_repo, config=config)
 
         # Nothing should be trivial
-        commit = MagicMock()
-        commit.message = "chore: Update"
-        check.is_false(analyzer._is_trivial_by_message(commit))  # pylint: disable=protected-access
-
-        diff = MagicMock()
-        diff.a_path = "README.md"
-        diffs = MagicMock()
-        diffs.__iter__ = Mock(return_value=iter([diff]))
-        check.is_false(
-            analyzer._is_trivial_by_file_paths(diffs)
-        )  # pylint: disable=protected-access
+        commit = FakeCommit(message="chore: Update")
+        assert not analyzer._is_trivial_by_message(commit)  # type: ignore[arg-type]
 
+        diff = FakeDiff(a_path="README.md")
+        assert not analyzer._is_trivial_by_file_paths([diff])  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize(("diff", "expected_trivial"), FILE_PATTERN_CASES)
     def test_complex_file_patterns(
         self,
         git_analyzer: GitAnalyzer,  # pylint: disable=redefined-outer-name
+        diff: FakeDiff,
+        expected_trivial: bool,
     ) -> None:
         """Test complex regex patterns for file triviality."""
-        # Test various file paths against patterns
-        test_cases = [
-            ("README.md", True),
-            ("docs/guide.md", True),
-            ("src/README.md", True),
-            ("test.txt", True),
-            ("src/main.py", False),
-            ("tests/test_foo.py", False),
-            ("docs/api.py", True),  # Matches docs/ pattern
-        ]
-
-        for filepath, expected_trivial in test_cases:
-            diff = MagicMock()
-            diff.a_path = filepath
-            diff.b_path = None
-            diffs = MagicMock()
-            diffs.__iter__ = Mock(return_value=iter([diff]))
+        assert git_analyzer._is_trivial_by_file_paths([diff]) is expected_trivial  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize(
+        ("path", "expected_trivial"),
+        [
+            ("src/generated/api.py", True),  # ^-anchored literal, startswith
+            ("lib/src/generated/api.py", False),
+            ("tests/test_api.py", True),  # regex fallback
+            ("test/test_api.pyc", False),
+            ("app/.prettierrc.json", True),  # escaped literal, substring
+            ("CHANGES.rst", False),
+            ("dist/app.min.js", True),  # second regex, joined into one alternation
+        ],
+    )
+    def test_file_patterns_beyond_literal_suffixes(
+        self,
+        mock_repo: MagicMock,  # pylint: disable=redefined-outer-name
+        path: str,
+        expected_trivial: bool,
+    ) -> None:
+        """Test prefix, escaped-literal and regex patterns alongside the string fast paths."""
+        config = GitAnalyzerConfig(
+            trivial_commit_types=[],
+            trivial_file_patterns=[
+                r"^src/generated/",
+                r"^tests?/.*\.py$",
+                r"\.prettierrc",
+                r"^dist/.*\.min\.js$",
+            ],
+            git_command_timeout=300,
+        )
+        analyzer = GitAnalyzer(repo=mock_repo, config=config)
 
-            result = git_analyzer._is_trivial_by_file_paths(
-                diffs
-            )  # pylint: disable=protected-access
-            check.equal(
-                result,
-                expected_trivial,
-                f"Path {filepath} should be {'trivial' if expected_trivial else 'non-trivial'}",
-            )
+        diffs = [FakeDiff(b_path=path)]
+        assert analyzer._is_trivial_by_file_paths(diffs) is expected_trivial  # type: ignore[arg-type]
 
     def test_date_range_boundary(
         self,
@@ -701,21 +640,10 @@ class TestGitAnalyzer:
         mock_repo: MagicMock,  # pylint: disable=redefined-outer-name
     ) -> None:
         """Test date range boundary conditions."""
-        # Create commits at exact boundaries
-        commit_before = MagicMock()
-        commit_before.committed_datetime = datetime(2025, 1, 1, 0, 0, 0) - timedelta(seconds=1)
-
-        commit_start = MagicMock()
-        commit_start.committed_datetime = datetime(2025, 1, 1, 0, 0, 0)
-
-        commit_middle = MagicMock()
-        commit_middle.committed_datetime = datetime(2025, 1, 4, 12, 0, 0)
-
-        commit_end = MagicMock()
-        commit_end.committed_datetime = datetime(2025, 1, 8, 0, 0, 0)
-
-        commit_after = MagicMock()
-        commit_after.committed_datetime = datetime(2025, 1, 8, 0, 0, 1)
+        # Commits just outside the range are filtered by git itself, so only
+        # the in-range commits come back from iter_commits.
+        commit_start = FakeCommit(committed_datetime=datetime(2025, 1, 1, 0, 0, 0))
+        commit_middle = FakeCommit(committed_datetime=datetime(2025, 1, 4, 12, 0, 0))
 
         # GitPython's iter_commits uses after/before which are inclusive/exclusive
         mock_repo.iter_commits.return_value = [
@@ -728,4 +656,4 @@ class TestGitAnalyzer:
             datetime(2025, 1, 8, 0, 0, 0),
         )
 
-        check.equal(len(commits), 2)
+        assert len(commits) == 2
@@ -3,16 +3,44 @@
 
 """Additional tests for git_analyzer to improve coverage."""
 
-from unittest.mock import MagicMock
+from collections.abc import Iterator
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
 
 import allure
 from git import GitCommandError
-import pytest_check as check
+import pytest
 
 from git_ai_reporter.analysis.git_analyzer import GitAnalyzer
 from git_ai_reporter.analysis.git_analyzer import GitAnalyzerConfig
 
 
+@dataclass(slots=True)
+class StubRepo:
+    """Minimal stand-in for ``git.Repo`` exposing only ``iter_commits``."""
+
+    commits: list[Any] = field(default_factory=list)
+    error: Exception | None = None
+
+    def iter_commits(self, *_args: Any, **_kwargs: Any) -> Iterator[Any]:
+        """Return the configured commits, or raise the configured error."""
+        if self.error is not None:
+            raise self.error
+        return iter(self.commits)
+
+
+@pytest.fixture(scope="module")
+def analyzer_config() -> GitAnalyzerConfig:
+    """Create the GitAnalyzerConfig shared by every test in this module."""
+    return GitAnalyzerConfig(
+        trivial_commit_types=["chore", "docs", "style"],
+        trivial_file_patterns=[r"\.md$", r"docs/", r"\.txt$"],
+        git_command_timeout=300,
+        debug=False,
+    )
+
+
 @allure.feature("Analysis - Git Analyzer Coverage")
 class TestGitAnalyzerCoverage:
     """Tests to cover specific uncovered lines in git_analyzer."""
@@ -24,31 +52,14 @@ class TestGitAnalyzerCoverage:
     )
     @allure.severity(allure.severity_level.NORMAL)
     @allure.tag("analysis", "git", "edge-case")
-    def test_get_first_commit_date_no_commits(self) -> None:
+    def test_get_first_commit_date_no_commits(
+        self,
+        analyzer_config: GitAnalyzerConfig,  # pylint: disable=redefined-outer-name
+    ) -> None:
         """Test get_first_commit_date when no commits exist - covers line 182."""
-        with allure.step("Setup mock repository with no commits"):
-            mock_repo = MagicMock()
-            mock_repo.iter_commits.return_value = []  # No commits
-
-        with allure.step("Create GitAnalyzer configuration"):
-            config = GitAnalyzerConfig(
-                trivial_commit_types=["chore", "docs", "style"],
-                trivial_file_patterns=[r"\.md$", r"docs/", r"\.txt$"],
-                git_command_timeout=300,
-                debug=False,
-            )
-
-        with allure.step("Initialize analyzer and get first commit date"):
-            analyzer = GitAnalyzer(repo=mock_repo, config=config)
-            result = analyzer.get_first_commit_date()
-
-        with allure.step("Verify None is returned for empty repository"):
-            check.is_none(result)
-            allure.attach(
-                "No commits found, returned None as expected",
-                "Empty Repo Test",
-                allure.attachment_type.TEXT,
-            )
+        analyzer = GitAnalyzer(repo=StubRepo(), config=analyzer_config)  # type: ignore[arg-type]
+
+        assert analyzer.get_first_commit_date() is None, "Expected None for a repo with no commits"
 
     @allure.story("Analysis Logic")
     @allure.title("Git analyzer handles git command errors gracefully")
@@ -57,28 +68,12 @@ class TestGitAnalyzerCoverage:
     )
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.tag("analysis", "git", "error-handling")
-    def test_get_first_commit_date_git_command_error(self) -> None:
+    def test_get_first_commit_date_git_command_error(
+        self,
+        analyzer_config: GitAnalyzerConfig,  # pylint: disable=redefined-outer-name
+    ) -> None:
         """Test get_first_commit_date when GitCommandError occurs - covers lines 184-185."""
-        with allure.step("Setup mock repository to raise GitCommandError"):
-            mock_repo = MagicMock()
-            mock_repo.iter_commits.side_effect = GitCommandError("command failed")
-
-        with allure.step("Create GitAnalyzer configuration"):
-            config = GitAnalyzerConfig(
-                trivial_commit_types=["chore", "docs", "style"],
-                trivial_file_patterns=[r"\.md$", r"docs/", r"\.txt$"],
-                git_command_timeout=300,
-                debug=False,
-            )
-
-        with allure.step("Initialize analyzer and handle git command error"):
-            analyzer = GitAnalyzer(repo=mock_repo, config=config)
-            result = analyzer.get_first_commit_date()
-
-        with allure.step("Verify None is returned on git command error"):
-            check.is_none(result)
-            allure.attach(
-                "GitCommandError handled gracefully, returned None",
-                "Error Handling Test",
-                allure.attachment_type.TEXT,
-            )
+        stub_repo = StubRepo(error=GitCommandError("command failed"))
+        analyzer = GitAnalyzer(repo=stub_repo, config=analyzer_config)  # type: ignore[arg-type]
+
+        assert analyzer.get_first_commit_date() is None, "Expected None when git log fails"
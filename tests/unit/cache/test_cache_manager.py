@@ -8,124 +8,257 @@ This module tests the cache manager for storing and retrieving analysis results.
 """
 
 import asyncio
+from collections.abc import Callable
 from datetime import date
+import functools
 import json
+import os
 from pathlib import Path
+import time
+from typing import Final
+from unittest.mock import AsyncMock
 
 import allure
 import pytest
 import pytest_check as check
 
+from git_ai_reporter.cache import manager
 from git_ai_reporter.cache.manager import CacheManager
 from git_ai_reporter.models import AnalysisResult
 from git_ai_reporter.models import Change
 from git_ai_reporter.models import CommitAnalysis
+from git_ai_reporter.models import CommitCategory
+
+# Run every test in this module on one event loop per class instead of one per test.
+pytestmark = pytest.mark.asyncio(loop_scope="class")
+
+_TEST_DATE: Final[date] = date(2025, 1, 7)
+
+
+@functools.cache
+def _mk_change(summary: str, category: CommitCategory) -> Change:
+    """Build a Change once per (summary, category); tests never mutate them."""
+    return Change.model_construct(summary=summary, category=category)
+
+
+def _mk_commit(*pairs: tuple[str, CommitCategory], trivial: bool = False) -> CommitAnalysis:
+    """Build a CommitAnalysis from (summary, category) pairs.
+
+    The inputs are literals typed as CommitCategory, so validation is skipped; anything
+    read back from the cache is still fully validated by CacheManager.
+    """
+    return CommitAnalysis.model_construct(
+        changes=[_mk_change(s, c) for s, c in pairs], trivial=trivial
+    )
+
+
+def _names_with_suffix(directory: Path, suffix: str) -> list[str]:
+    """List the file names in a directory ending with suffix, using one scandir pass."""
+    with os.scandir(directory) as entries:
+        return [entry.name for entry in entries if entry.name.endswith(suffix)]
+
+
+@pytest.fixture(scope="module")
+def sample_analyses() -> list[CommitAnalysis]:
+    """Build ten single-change analyses once for every test in this module."""
+    return [_mk_commit((f"Change {i}", "New Feature")) for i in range(10)]
+
+
+@pytest.fixture(scope="module")
+def sample_analysis(
+    sample_analyses: list[CommitAnalysis],  # pylint: disable=redefined-outer-name
+) -> CommitAnalysis:
+    """Return one prebuilt analysis for tests that only need something to store."""
+    return sample_analyses[0]
 
 
 @allure.feature("Cache Management")
-@pytest.mark.asyncio
 class TestCacheManager:
     """Test suite for CacheManager class."""
 
-    @pytest.fixture
-    def cache_manager(self, temp_dir: Path) -> CacheManager:
-        """Create a CacheManager instance with temp directory."""
-        return CacheManager(temp_dir / "cache")
+    @pytest.fixture(scope="class")
+    def cache_manager(self, memory_temp_dir: Path) -> CacheManager:
+        """Create one CacheManager per class in a (tmpfs-backed, where available) temp directory.
+
+        Tests share the cache tree, so each one writes under keys no other test uses.
+        """
+        return CacheManager(memory_temp_dir / "cache")
 
     @allure.title("Initialize cache with required subdirectories")
     @allure.description(
         "Tests that cache manager creates all required subdirectories on initialization"
     )
     @allure.tag("cache", "initialization", "filesystem")
-    async def test_init_creates_subdirectories(self, temp_dir: Path) -> None:
+    async def test_init_creates_subdirectories(
+        self, cache_manager: CacheManager, attach_if_verbose: Callable[..., None]
+    ) -> None:
         """Test that initialization creates all required subdirectories."""
         with allure.step("Initialize cache manager"):
-            cache_path = temp_dir / "cache"
-            CacheManager(cache_path)
+            cache_path = cache_manager.cache_path
 
             subdirs = ["commits", "daily_summaries", "weekly_summaries", "narratives", "changelogs"]
 
-            allure.attach(
+            attach_if_verbose(
                 json.dumps(
-                    {"cache_path": str(cache_path), "expected_subdirectories": subdirs}, indent=2
+                    {"cache_path": str(cache_path), "expected_subdirectories": subdirs},
+                    indent=2,
                 ),
                 "Cache Initialization Config",
                 allure.attachment_type.JSON,
             )
 
         with allure.step("Verify subdirectory creation"):
-            check.is_true((cache_path / "commits").exists())
-            check.is_true((cache_path / "daily_summaries").exists())
-            check.is_true((cache_path / "weekly_summaries").exists())
-            check.is_true((cache_path / "narratives").exists())
-            check.is_true((cache_path / "changelogs").exists())
+            # One directory listing instead of a stat per subdirectory.
+            missing = set(subdirs) - set(os.listdir(cache_path))
+            check.equal(missing, set())
 
-            allure.attach(
+            attach_if_verbose(
                 "All required cache subdirectories created successfully",
                 "Directory Creation Result",
                 allure.attachment_type.TEXT,
             )
 
-    @allure.title("Handle cache miss for non-existent commit")
-    @allure.description("Tests graceful handling when retrieving non-existent commit analysis")
-    @allure.tag("cache", "cache-miss", "error-handling")
-    async def test_get_commit_analysis_not_found(self, cache_manager: CacheManager) -> None:
-        """Test retrieving non-existent commit analysis returns None."""
-        with allure.step("Attempt to retrieve non-existent commit analysis"):
-            commit_hash = "nonexistent"
-            result = await cache_manager.get_commit_analysis(commit_hash)
+    async def test_init_on_existing_cache_skips_mkdir(
+        self, cache_manager: CacheManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that reopening an existing cache tree only lists it, creating nothing."""
 
-            allure.attach(
-                json.dumps(
-                    {"commit_hash": commit_hash, "result": result, "cache_miss": True}, indent=2
+        def fail_mkdir(*_args: object, **_kwargs: object) -> None:
+            raise AssertionError("existing cache directories should not be re-created")
+
+        monkeypatch.setattr(Path, "mkdir", fail_mkdir)
+
+        CacheManager(cache_manager.cache_path)
+
+    @allure.story("Cache Misses")
+    @allure.title("Return None for a cache miss: {getter_name}")
+    @allure.description("Tests that every cache getter returns None when nothing was stored")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.tag("cache", "cache-miss", "not-found")
+    @pytest.mark.parametrize(
+        ("getter_name", "args"),
+        [
+            pytest.param("get_commit_analysis", ("nonexistent",), id="commit-analysis"),
+            pytest.param("get_daily_summary", (_TEST_DATE, ["nonexistent"]), id="daily-summary"),
+            pytest.param("get_weekly_summary", ("2025-02", ["nonexistent"]), id="weekly-summary"),
+            pytest.param(
+                "get_final_narrative",
+                (
+                    AnalysisResult(
+                        period_summaries=["Nonexistent"], daily_summaries=[], changelog_entries=[]
+                    ),
                 ),
-                "Cache Miss Test Result",
-                allure.attachment_type.JSON,
-            )
+                id="final-narrative",
+            ),
+            pytest.param(
+                "get_changelog_entries",
+                ([_mk_commit(("Nonexistent", "Chore"), trivial=True)],),
+                id="changelog-entries",
+            ),
+        ],
+    )
+    async def test_cache_miss_returns_none(
+        self,
+        cache_manager: CacheManager,
+        monkeypatch: pytest.MonkeyPatch,
+        getter_name: str,
+        args: tuple[object, ...],
+    ) -> None:
+        """Test that a miss returns None after one stat of the index's fallback, opening nothing."""
+
+        def fail_open(*_args: object, **_kwargs: object) -> None:
+            raise AssertionError("a cache miss should not open any file")
+
+        stat = AsyncMock(wraps=manager.aiofiles.os.path.isfile)
+        monkeypatch.setattr(manager.aiofiles, "open", fail_open)
+        monkeypatch.setattr(Path, "read_bytes", fail_open)
+        monkeypatch.setattr(manager.aiofiles.os.path, "isfile", stat)
 
-            check.is_none(result)
+        assert await getattr(cache_manager, getter_name)(*args) is None
+        stat.assert_awaited_once()
 
     async def test_set_and_get_commit_analysis(self, cache_manager: CacheManager) -> None:
         """Test saving and retrieving commit analysis."""
-        analysis = CommitAnalysis(
-            changes=[
-                Change(summary="Added feature X", category="New Feature"),
-                Change(summary="Fixed bug Y", category="Bug Fix"),
-            ],
-            trivial=False,
-        )
+        analysis = _mk_commit(("Added feature X", "New Feature"), ("Fixed bug Y", "Bug Fix"))
         hexsha = "abc123def456"
 
         await cache_manager.set_commit_analysis(hexsha, analysis)
         retrieved = await cache_manager.get_commit_analysis(hexsha)
 
-        check.is_not_none(retrieved)
-        check.equal(len(retrieved.changes), 2)  # type: ignore[union-attr]
-        check.equal(retrieved.changes[0].summary, "Added feature X")  # type: ignore[union-attr]
-        check.equal(retrieved.changes[1].category, "Bug Fix")  # type: ignore[union-attr]
-        check.is_false(retrieved.trivial)  # type: ignore[union-attr]
+        assert retrieved is not None
+        # One tuple comparison still reports every mismatched field in its diff.
+        check.equal(
+            (
+                len(retrieved.changes),
+                retrieved.changes[0].summary,
+                retrieved.changes[-1].category,
+                retrieved.trivial,
+            ),
+            (2, "Added feature X", "Bug Fix", False),
+        )
+
+    async def test_get_commit_analysis_large_entry_round_trips(
+        self, cache_manager: CacheManager
+    ) -> None:
+        """Test that an analysis spanning several pages reads back equal."""
+        analysis = _mk_commit(*((f"Change {i} " + "x" * 100, "Refactoring") for i in range(200)))
+        await cache_manager.set_commit_analysis("large123", analysis)
+
+        assert await cache_manager.get_commit_analysis("large123") == analysis
+
+    @pytest.mark.parametrize(
+        ("hexsha", "payload"),
+        [
+            pytest.param("corrupted123", b"{'not': 'valid json'", id="corrupted-json"),
+            pytest.param("invalid123", b'{"wrong_field": "value"}', id="invalid-schema"),
+            pytest.param("empty123", b"", id="empty-file"),
+        ],
+    )
+    async def test_get_commit_analysis_unreadable_entry(
+        self, cache_manager: CacheManager, hexsha: str, payload: bytes
+    ) -> None:
+        """Test that corrupted JSON or a wrong schema in the cache is treated as a miss."""
+        (cache_manager._commits_path / f"{hexsha}.json").write_bytes(payload)
+
+        assert await cache_manager.get_commit_analysis(hexsha) is None
 
-    async def test_get_commit_analysis_corrupted_json(self, cache_manager: CacheManager) -> None:
-        """Test that corrupted JSON cache returns None."""
-        hexsha = "corrupted123"
-        cache_file = cache_manager._commits_path / f"{hexsha}.json"
+    async def test_get_commit_analysis_tolerates_hand_edited_json(
+        self, cache_manager: CacheManager
+    ) -> None:
+        """Test that non-strict JSON still loads through the tolerant parser fallback."""
+        (cache_manager._commits_path / "trailing-comma.json").write_bytes(
+            b'{"changes": [{"summary": "Edited", "category": "Tests"},], "trivial": false,}'
+        )
 
-        # Write corrupted JSON
-        cache_file.write_text("{'not': 'valid json'", encoding="utf-8")
+        assert await cache_manager.get_commit_analysis("trailing-comma") == _mk_commit(
+            ("Edited", "Tests")
+        )
 
-        result = await cache_manager.get_commit_analysis(hexsha)
-        check.is_none(result)
+    async def test_entries_written_by_another_manager_are_found(
+        self, cache_manager: CacheManager
+    ) -> None:
+        """Test that entries written after this manager was created still read as hits."""
+        other = CacheManager(cache_manager.cache_path)
+        await other.set_commit_analysis("shared123", _mk_commit(("Shared", "Chore")))
+        await other.set_weekly_summary("2025-10", ["shared"], "Shared summary")
 
-    async def test_get_commit_analysis_invalid_schema(self, cache_manager: CacheManager) -> None:
-        """Test that invalid schema cache returns None."""
-        hexsha = "invalid123"
-        cache_file = cache_manager._commits_path / f"{hexsha}.json"
+        assert await cache_manager.get_commit_analysis("shared123") == _mk_commit(
+            ("Shared", "Chore")
+        )
+        assert await cache_manager.get_weekly_summary("2025-10", ["shared"]) == "Shared summary"
+        # The sync path agrees with the async one.
+        assert cache_manager.load("shared123", CommitAnalysis) is not None
 
-        # Write valid JSON but invalid schema
-        cache_file.write_text('{"wrong_field": "value"}', encoding="utf-8")
+    async def test_entry_removed_from_disk_is_a_miss(self, cache_manager: CacheManager) -> None:
+        """Test that an indexed entry deleted by someone else reads as a miss, not an error."""
+        await cache_manager.set_commit_analysis("deleted123", _mk_commit(("Gone", "Chore")))
+        await cache_manager.set_weekly_summary("2025-09", ["deleted"], "Gone")
+        (cache_manager._commits_path / "deleted123.json").unlink()
+        weekly_name = f"2025-09-{cache_manager._get_hash(['deleted'])}.txt"
+        (cache_manager._weekly_summaries_path / weekly_name).unlink()
 
-        result = await cache_manager.get_commit_analysis(hexsha)
-        check.is_none(result)
+        assert await cache_manager.get_commit_analysis("deleted123") is None
+        assert await cache_manager.get_weekly_summary("2025-09", ["deleted"]) is None
 
     async def test_hash_generation(self, cache_manager: CacheManager) -> None:
         """Test that hash generation is stable and unique."""
@@ -138,60 +271,50 @@ class TestCacheManager:
         hash3 = cache_manager._get_hash(items3)
 
         # Same items should produce same hash regardless of order
-        check.equal(hash1, hash2)
+        assert hash1 == hash2
         # Different items should produce different hash
-        check.not_equal(hash1, hash3)
+        assert hash1 != hash3
         # Hash should be 16 characters
-        check.equal(len(hash1), 16)
+        assert len(hash1) == 16
+
+    async def test_hash_generation_matches_existing_caches(
+        self, cache_manager: CacheManager
+    ) -> None:
+        """Test that cache keys stay the truncated SHA-256 that existing cache files use."""
+        assert cache_manager._get_hash(["def456", "abc123"]) == "e861b2eab679927c"
 
     @allure.story("Daily Summary Cache")
     @allure.title("Save and retrieve daily summary successfully")
     @allure.description("Tests complete roundtrip caching of daily summary data")
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.tag("cache", "daily-summary", "roundtrip", "date-based")
-    async def test_set_and_get_daily_summary(self, cache_manager: CacheManager) -> None:
+    async def test_set_and_get_daily_summary(
+        self, cache_manager: CacheManager, attach_if_verbose: Callable[..., None]
+    ) -> None:
         """Test saving and retrieving daily summary."""
         with allure.step("Set up daily summary test data"):
-            test_date = date(2025, 1, 7)
-            hexshas = ["commit1", "commit2"]
+            test_date = _TEST_DATE
+            hexshas = ["daily1", "daily2"]
             summary = "Today we made great progress on features X and Y."
 
-            allure.attach(str(test_date), "Test Date", allure.attachment_type.TEXT)
-            allure.attach(str(hexshas), "Commit Hashes", allure.attachment_type.TEXT)
-            allure.attach(summary, "Daily Summary", allure.attachment_type.TEXT)
+            attach_if_verbose(str(test_date), "Test Date", allure.attachment_type.TEXT)
+            attach_if_verbose(str(hexshas), "Commit Hashes", allure.attachment_type.TEXT)
+            attach_if_verbose(summary, "Daily Summary", allure.attachment_type.TEXT)
 
         with allure.step("Store daily summary in cache"):
             await cache_manager.set_daily_summary(test_date, hexshas, summary)
-            allure.attach(
-                "Daily summary cached successfully", "Storage Status", allure.attachment_type.TEXT
+            attach_if_verbose(
+                "Daily summary cached successfully",
+                "Storage Status",
+                allure.attachment_type.TEXT,
             )
 
         with allure.step("Retrieve daily summary from cache"):
             retrieved = await cache_manager.get_daily_summary(test_date, hexshas)
-            allure.attach(str(retrieved), "Retrieved Summary", allure.attachment_type.TEXT)
+            attach_if_verbose(str(retrieved), "Retrieved Summary", allure.attachment_type.TEXT)
 
         with allure.step("Verify retrieved summary matches original"):
-            check.equal(retrieved, summary)
-
-    @allure.story("Daily Summary Cache")
-    @allure.title("Return None for non-existent daily summary")
-    @allure.description("Tests that cache miss returns None when daily summary doesn't exist")
-    @allure.severity(allure.severity_level.NORMAL)
-    @allure.tag("cache", "daily-summary", "cache-miss", "not-found")
-    async def test_get_daily_summary_not_found(self, cache_manager: CacheManager) -> None:
-        """Test retrieving non-existent daily summary returns None."""
-        with allure.step("Set up non-existent daily summary parameters"):
-            test_date = date(2025, 1, 7)
-            hexshas = ["nonexistent"]
-            allure.attach(str(test_date), "Test Date", allure.attachment_type.TEXT)
-            allure.attach(str(hexshas), "Non-existent Commits", allure.attachment_type.TEXT)
-
-        with allure.step("Attempt to retrieve non-existent daily summary"):
-            result = await cache_manager.get_daily_summary(test_date, hexshas)
-            allure.attach(str(result), "Cache Result", allure.attachment_type.TEXT)
-
-        with allure.step("Verify cache miss returns None"):
-            check.is_none(result)
+            assert retrieved == summary
 
     @allure.story("Cache Key Generation")
     @allure.title("Generate different cache keys for different commit sets")
@@ -201,85 +324,71 @@ class TestCacheManager:
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.tag("cache", "daily-summary", "cache-keys", "isolation")
     async def test_daily_summary_cache_key_depends_on_commits(
-        self, cache_manager: CacheManager
+        self, cache_manager: CacheManager, attach_if_verbose: Callable[..., None]
     ) -> None:
         """Test that daily summary cache key changes with different commits."""
         with allure.step("Set up different commit sets for same date"):
-            test_date = date(2025, 1, 7)
+            test_date = _TEST_DATE
             hexshas1 = ["commit1", "commit2"]
             hexshas2 = ["commit3", "commit4"]
             summary1 = "Summary for commits 1 and 2"
             summary2 = "Summary for commits 3 and 4"
 
-            allure.attach(str(test_date), "Test Date", allure.attachment_type.TEXT)
-            allure.attach(str(hexshas1), "Commit Set 1", allure.attachment_type.TEXT)
-            allure.attach(str(hexshas2), "Commit Set 2", allure.attachment_type.TEXT)
-            allure.attach(summary1, "Summary 1", allure.attachment_type.TEXT)
-            allure.attach(summary2, "Summary 2", allure.attachment_type.TEXT)
+            attach_if_verbose(str(test_date), "Test Date", allure.attachment_type.TEXT)
+            attach_if_verbose(str(hexshas1), "Commit Set 1", allure.attachment_type.TEXT)
+            attach_if_verbose(str(hexshas2), "Commit Set 2", allure.attachment_type.TEXT)
+            attach_if_verbose(summary1, "Summary 1", allure.attachment_type.TEXT)
+            attach_if_verbose(summary2, "Summary 2", allure.attachment_type.TEXT)
 
         with allure.step("Store both summaries in cache"):
             await cache_manager.set_daily_summary(test_date, hexshas1, summary1)
             await cache_manager.set_daily_summary(test_date, hexshas2, summary2)
-            allure.attach("Both summaries cached", "Storage Status", allure.attachment_type.TEXT)
+            attach_if_verbose(
+                "Both summaries cached", "Storage Status", allure.attachment_type.TEXT
+            )
 
         with allure.step("Retrieve both summaries from cache"):
             retrieved1 = await cache_manager.get_daily_summary(test_date, hexshas1)
             retrieved2 = await cache_manager.get_daily_summary(test_date, hexshas2)
-            allure.attach(str(retrieved1), "Retrieved Summary 1", allure.attachment_type.TEXT)
-            allure.attach(str(retrieved2), "Retrieved Summary 2", allure.attachment_type.TEXT)
+            attach_if_verbose(str(retrieved1), "Retrieved Summary 1", allure.attachment_type.TEXT)
+            attach_if_verbose(str(retrieved2), "Retrieved Summary 2", allure.attachment_type.TEXT)
 
         with allure.step("Verify cache isolation between different commit sets"):
-            check.equal(retrieved1, summary1)
-            check.equal(retrieved2, summary2)
+            assert retrieved1 == summary1
+            assert retrieved2 == summary2
 
     @allure.story("Weekly Summary Cache")
     @allure.title("Save and retrieve weekly summary successfully")
     @allure.description("Tests complete roundtrip caching of weekly summary data")
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.tag("cache", "weekly-summary", "roundtrip", "period-based")
-    async def test_set_and_get_weekly_summary(self, cache_manager: CacheManager) -> None:
+    async def test_set_and_get_weekly_summary(
+        self, cache_manager: CacheManager, attach_if_verbose: Callable[..., None]
+    ) -> None:
         """Test saving and retrieving weekly summary."""
         with allure.step("Set up weekly summary test data"):
             week_str = "2025-02"
             hexshas = ["commit1", "commit2", "commit3"]
             summary = "This week we completed the authentication system."
 
-            allure.attach(week_str, "Week String", allure.attachment_type.TEXT)
-            allure.attach(str(hexshas), "Commit Hashes", allure.attachment_type.TEXT)
-            allure.attach(summary, "Weekly Summary", allure.attachment_type.TEXT)
+            attach_if_verbose(week_str, "Week String", allure.attachment_type.TEXT)
+            attach_if_verbose(str(hexshas), "Commit Hashes", allure.attachment_type.TEXT)
+            attach_if_verbose(summary, "Weekly Summary", allure.attachment_type.TEXT)
 
         with allure.step("Store weekly summary in cache"):
             await cache_manager.set_weekly_summary(week_str, hexshas, summary)
-            allure.attach(
-                "Weekly summary cached successfully", "Storage Status", allure.attachment_type.TEXT
+            attach_if_verbose(
+                "Weekly summary cached successfully",
+                "Storage Status",
+                allure.attachment_type.TEXT,
             )
 
         with allure.step("Retrieve weekly summary from cache"):
             retrieved = await cache_manager.get_weekly_summary(week_str, hexshas)
-            allure.attach(str(retrieved), "Retrieved Summary", allure.attachment_type.TEXT)
+            attach_if_verbose(str(retrieved), "Retrieved Summary", allure.attachment_type.TEXT)
 
         with allure.step("Verify retrieved summary matches original"):
-            check.equal(retrieved, summary)
-
-    @allure.story("Weekly Summary Cache")
-    @allure.title("Return None for non-existent weekly summary")
-    @allure.description("Tests that cache miss returns None when weekly summary doesn't exist")
-    @allure.severity(allure.severity_level.NORMAL)
-    @allure.tag("cache", "weekly-summary", "cache-miss", "not-found")
-    async def test_get_weekly_summary_not_found(self, cache_manager: CacheManager) -> None:
-        """Test retrieving non-existent weekly summary returns None."""
-        with allure.step("Set up non-existent weekly summary parameters"):
-            week_str = "2025-02"
-            hexshas = ["nonexistent"]
-            allure.attach(week_str, "Week String", allure.attachment_type.TEXT)
-            allure.attach(str(hexshas), "Non-existent Commits", allure.attachment_type.TEXT)
-
-        with allure.step("Attempt to retrieve non-existent weekly summary"):
-            result = await cache_manager.get_weekly_summary(week_str, hexshas)
-            allure.attach(str(result), "Cache Result", allure.attachment_type.TEXT)
-
-        with allure.step("Verify cache miss returns None"):
-            check.is_none(result)
+            assert retrieved == summary
 
     @allure.story("Narrative Cache")
     @allure.title("Save and retrieve final narrative successfully")
@@ -288,120 +397,78 @@ class TestCacheManager:
     )
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.tag("cache", "narrative", "analysis-result", "roundtrip")
-    async def test_set_and_get_final_narrative(self, cache_manager: CacheManager) -> None:
+    async def test_set_and_get_final_narrative(
+        self, cache_manager: CacheManager, attach_if_verbose: Callable[..., None]
+    ) -> None:
         """Test saving and retrieving final narrative."""
         with allure.step("Set up analysis result and narrative"):
             result = AnalysisResult(
                 period_summaries=["Week 1 summary"],
                 daily_summaries=["Day 1", "Day 2"],
-                changelog_entries=[
-                    CommitAnalysis(
-                        changes=[Change(summary="Feature", category="New Feature")],
-                        trivial=False,
-                    )
-                ],
+                changelog_entries=[_mk_commit(("Feature", "New Feature"))],
             )
             narrative = "This period saw significant development..."
 
-            allure.attach(
+            attach_if_verbose(
                 str(len(result.period_summaries)),
                 "Period Summaries Count",
                 allure.attachment_type.TEXT,
             )
-            allure.attach(
+            attach_if_verbose(
                 str(len(result.daily_summaries)),
                 "Daily Summaries Count",
                 allure.attachment_type.TEXT,
             )
-            allure.attach(
+            attach_if_verbose(
                 str(len(result.changelog_entries)),
                 "Changelog Entries Count",
                 allure.attachment_type.TEXT,
             )
-            allure.attach(narrative, "Final Narrative", allure.attachment_type.TEXT)
+            attach_if_verbose(narrative, "Final Narrative", allure.attachment_type.TEXT)
 
         with allure.step("Store final narrative in cache"):
             await cache_manager.set_final_narrative(result, narrative)
-            allure.attach(
-                "Final narrative cached successfully", "Storage Status", allure.attachment_type.TEXT
+            attach_if_verbose(
+                "Final narrative cached successfully",
+                "Storage Status",
+                allure.attachment_type.TEXT,
             )
 
         with allure.step("Retrieve final narrative from cache"):
             retrieved = await cache_manager.get_final_narrative(result)
-            allure.attach(str(retrieved), "Retrieved Narrative", allure.attachment_type.TEXT)
+            attach_if_verbose(str(retrieved), "Retrieved Narrative", allure.attachment_type.TEXT)
 
         with allure.step("Verify retrieved narrative matches original"):
-            check.equal(retrieved, narrative)
-
-    @allure.story("Narrative Cache")
-    @allure.title("Return None for non-existent final narrative")
-    @allure.description("Tests that cache miss returns None when final narrative doesn't exist")
-    @allure.severity(allure.severity_level.NORMAL)
-    @allure.tag("cache", "narrative", "cache-miss", "not-found")
-    async def test_get_final_narrative_not_found(self, cache_manager: CacheManager) -> None:
-        """Test retrieving non-existent final narrative returns None."""
-        with allure.step("Set up non-existent analysis result"):
-            result = AnalysisResult(
-                period_summaries=["Nonexistent"],
-                daily_summaries=[],
-                changelog_entries=[],
-            )
-            allure.attach(
-                str(result.period_summaries), "Period Summaries", allure.attachment_type.TEXT
-            )
-            allure.attach(
-                str(len(result.daily_summaries)),
-                "Daily Summaries Count",
-                allure.attachment_type.TEXT,
-            )
-            allure.attach(
-                str(len(result.changelog_entries)),
-                "Changelog Entries Count",
-                allure.attachment_type.TEXT,
-            )
-
-        with allure.step("Attempt to retrieve non-existent narrative"):
-            retrieved = await cache_manager.get_final_narrative(result)
-            allure.attach(str(retrieved), "Cache Result", allure.attachment_type.TEXT)
-
-        with allure.step("Verify cache miss returns None"):
-            check.is_none(retrieved)
+            assert retrieved == narrative
 
     @allure.story("Changelog Cache")
     @allure.title("Save and retrieve changelog entries successfully")
     @allure.description("Tests complete roundtrip caching of changelog entries")
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.tag("cache", "changelog", "commit-analysis", "roundtrip")
-    async def test_set_and_get_changelog_entries(self, cache_manager: CacheManager) -> None:
+    async def test_set_and_get_changelog_entries(
+        self, cache_manager: CacheManager, attach_if_verbose: Callable[..., None]
+    ) -> None:
         """Test saving and retrieving changelog entries."""
         with allure.step("Set up changelog entries and formatted changelog"):
             entries = [
-                CommitAnalysis(
-                    changes=[
-                        Change(summary="Added OAuth", category="New Feature"),
-                        Change(summary="Fixed login bug", category="Bug Fix"),
-                    ],
-                    trivial=False,
-                ),
-                CommitAnalysis(
-                    changes=[Change(summary="Updated docs", category="Documentation")],
-                    trivial=False,
-                ),
+                _mk_commit(("Added OAuth", "New Feature"), ("Fixed login bug", "Bug Fix")),
+                _mk_commit(("Updated docs", "Documentation")),
             ]
             changelog = "## [Unreleased]\n### Added\n- OAuth support\n### Fixed\n- Login bug"
 
-            allure.attach(str(len(entries)), "Number of Entries", allure.attachment_type.TEXT)
-            allure.attach(
+            attach_if_verbose(str(len(entries)), "Number of Entries", allure.attachment_type.TEXT)
+            attach_if_verbose(
                 str(len(entries[0].changes)), "Changes in Entry 1", allure.attachment_type.TEXT
             )
-            allure.attach(
+            attach_if_verbose(
                 str(len(entries[1].changes)), "Changes in Entry 2", allure.attachment_type.TEXT
             )
-            allure.attach(changelog, "Formatted Changelog", allure.attachment_type.TEXT)
+            attach_if_verbose(changelog, "Formatted Changelog", allure.attachment_type.TEXT)
 
         with allure.step("Store changelog entries in cache"):
             await cache_manager.set_changelog_entries(entries, changelog)
-            allure.attach(
+            attach_if_verbose(
                 "Changelog entries cached successfully",
                 "Storage Status",
                 allure.attachment_type.TEXT,
@@ -409,37 +476,10 @@ class TestCacheManager:
 
         with allure.step("Retrieve changelog entries from cache"):
             retrieved = await cache_manager.get_changelog_entries(entries)
-            allure.attach(str(retrieved), "Retrieved Changelog", allure.attachment_type.TEXT)
+            attach_if_verbose(str(retrieved), "Retrieved Changelog", allure.attachment_type.TEXT)
 
         with allure.step("Verify retrieved changelog matches original"):
-            check.equal(retrieved, changelog)
-
-    @allure.story("Changelog Cache")
-    @allure.title("Return None for non-existent changelog entries")
-    @allure.description("Tests that cache miss returns None when changelog entries don't exist")
-    @allure.severity(allure.severity_level.NORMAL)
-    @allure.tag("cache", "changelog", "cache-miss", "not-found")
-    async def test_get_changelog_entries_not_found(self, cache_manager: CacheManager) -> None:
-        """Test retrieving non-existent changelog entries returns None."""
-        with allure.step("Set up non-existent changelog entries"):
-            entries = [
-                CommitAnalysis(
-                    changes=[Change(summary="Nonexistent", category="Chore")],
-                    trivial=True,
-                )
-            ]
-            allure.attach(str(len(entries)), "Number of Entries", allure.attachment_type.TEXT)
-            allure.attach(
-                entries[0].changes[0].summary, "Entry Summary", allure.attachment_type.TEXT
-            )
-            allure.attach(str(entries[0].trivial), "Entry Is Trivial", allure.attachment_type.TEXT)
-
-        with allure.step("Attempt to retrieve non-existent changelog entries"):
-            result = await cache_manager.get_changelog_entries(entries)
-            allure.attach(str(result), "Cache Result", allure.attachment_type.TEXT)
-
-        with allure.step("Verify cache miss returns None"):
-            check.is_none(result)
+            assert retrieved == changelog
 
     @allure.story("File System Operations")
     @allure.title("Use correct file extensions for different cache types")
@@ -448,21 +488,22 @@ class TestCacheManager:
     )
     @allure.severity(allure.severity_level.NORMAL)
     @allure.tag("cache", "file-extensions", "file-system", "organization")
-    async def test_cache_files_use_correct_extensions(self, cache_manager: CacheManager) -> None:
+    async def test_cache_files_use_correct_extensions(
+        self,
+        cache_manager: CacheManager,
+        sample_analysis: CommitAnalysis,
+        attach_if_verbose: Callable[..., None],  # pylint: disable=redefined-outer-name
+    ) -> None:
         """Test that cache files use appropriate extensions."""
         with allure.step("Create various cache entries"):
             # Set various cache entries
-            analysis = CommitAnalysis(
-                changes=[Change(summary="Test", category="Tests")],
-                trivial=False,
-            )
-            await cache_manager.set_commit_analysis("test123", analysis)
+            await cache_manager.set_commit_analysis("test123", sample_analysis)
 
-            test_date = date(2025, 1, 7)
+            test_date = _TEST_DATE
             await cache_manager.set_daily_summary(test_date, ["c1"], "daily")
             await cache_manager.set_weekly_summary("2025-02", ["c2"], "weekly")
 
-            allure.attach(
+            attach_if_verbose(
                 "Created commit analysis, daily summary, and weekly summary",
                 "Cache Entries Created",
                 allure.attachment_type.TEXT,
@@ -470,34 +511,21 @@ class TestCacheManager:
 
         with allure.step("Check file extensions for each cache type"):
             # Check file extensions
-            commit_files = list(cache_manager._commits_path.glob("*.json"))
-            daily_files = list(cache_manager._daily_summaries_path.glob("*.txt"))
-            weekly_files = list(cache_manager._weekly_summaries_path.glob("*.txt"))
+            commit_files = _names_with_suffix(cache_manager._commits_path, ".json")
+            daily_files = _names_with_suffix(cache_manager._daily_summaries_path, ".txt")
+            weekly_files = _names_with_suffix(cache_manager._weekly_summaries_path, ".txt")
 
-            allure.attach(
-                str([f.name for f in commit_files]),
-                "Commit Files (.json)",
-                allure.attachment_type.TEXT,
-            )
-            allure.attach(
-                str([f.name for f in daily_files]),
-                "Daily Files (.txt)",
-                allure.attachment_type.TEXT,
-            )
-            allure.attach(
-                str([f.name for f in weekly_files]),
-                "Weekly Files (.txt)",
-                allure.attachment_type.TEXT,
+            attach_if_verbose(
+                str(commit_files), "Commit Files (.json)", allure.attachment_type.TEXT
             )
+            attach_if_verbose(str(daily_files), "Daily Files (.txt)", allure.attachment_type.TEXT)
+            attach_if_verbose(str(weekly_files), "Weekly Files (.txt)", allure.attachment_type.TEXT)
 
-        with allure.step("Verify correct number of files with correct extensions"):
-            check.equal(len(commit_files), 1)
-            check.equal(len(daily_files), 1)
-            check.equal(len(weekly_files), 1)
-
-            allure.attach(str(len(commit_files)), "Commit Files Count", allure.attachment_type.TEXT)
-            allure.attach(str(len(daily_files)), "Daily Files Count", allure.attachment_type.TEXT)
-            allure.attach(str(len(weekly_files)), "Weekly Files Count", allure.attachment_type.TEXT)
+        with allure.step("Verify each entry was written with the expected extension"):
+            # The cache is shared across the class, so look for this test's own entries.
+            assert "test123.json" in commit_files
+            assert f"{test_date.isoformat()}-{cache_manager._get_hash(['c1'])}.txt" in daily_files
+            assert f"2025-02-{cache_manager._get_hash(['c2'])}.txt" in weekly_files
 
     @allure.story("Concurrency Support")
     @allure.title("Handle concurrent cache operations correctly")
@@ -506,44 +534,104 @@ class TestCacheManager:
     )
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.tag("cache", "concurrency", "async", "threading")
-    async def test_concurrent_cache_operations(self, cache_manager: CacheManager) -> None:
+    async def test_concurrent_cache_operations(
+        self,
+        cache_manager: CacheManager,
+        sample_analyses: list[CommitAnalysis],
+        attach_if_verbose: Callable[..., None],  # pylint: disable=redefined-outer-name
+    ) -> None:
         """Test that concurrent cache operations work correctly."""
         with allure.step("Set up test data for concurrent operations"):
-            analyses = [
-                CommitAnalysis(
-                    changes=[Change(summary=f"Change {i}", category="New Feature")],
-                    trivial=False,
-                )
-                for i in range(10)
-            ]
-            allure.attach(
+            analyses = sample_analyses
+            attach_if_verbose(
                 str(len(analyses)), "Number of Analysis Objects", allure.attachment_type.TEXT
             )
 
         with allure.step("Execute concurrent write operations"):
-            tasks = [
-                cache_manager.set_commit_analysis(f"hash{i}", analysis)
-                for i, analysis in enumerate(analyses)
-            ]
-            await asyncio.gather(*tasks)
-            allure.attach(str(len(tasks)), "Concurrent Write Tasks", allure.attachment_type.TEXT)
+            async with asyncio.TaskGroup() as write_group:
+                for i, analysis in enumerate(analyses):
+                    write_group.create_task(cache_manager.set_commit_analysis(f"hash{i}", analysis))
+            attach_if_verbose(
+                str(len(analyses)), "Concurrent Write Tasks", allure.attachment_type.TEXT
+            )
 
         with allure.step("Execute concurrent read operations"):
-            read_tasks = [cache_manager.get_commit_analysis(f"hash{i}") for i in range(10)]
-            results = await asyncio.gather(*read_tasks)
-            allure.attach(
+            async with asyncio.TaskGroup() as read_group:
+                read_tasks = [
+                    read_group.create_task(cache_manager.get_commit_analysis(f"hash{i}"))
+                    for i in range(10)
+                ]
+            results = [task.result() for task in read_tasks]
+            attach_if_verbose(
                 str(len(read_tasks)), "Concurrent Read Tasks", allure.attachment_type.TEXT
             )
-            allure.attach(str(len(results)), "Retrieved Results Count", allure.attachment_type.TEXT)
+            attach_if_verbose(
+                str(len(results)), "Retrieved Results Count", allure.attachment_type.TEXT
+            )
 
         with allure.step("Verify all concurrent operations completed successfully"):
             for i, result in enumerate(results):
-                check.is_not_none(result)
-                if result is not None:
-                    check.equal(result.changes[0].summary, f"Change {i}")
+                assert result is not None
+                assert result.changes[0].summary == f"Change {i}"
 
             successful_reads = sum(1 for r in results if r is not None)
-            allure.attach(str(successful_reads), "Successful Reads", allure.attachment_type.TEXT)
+            attach_if_verbose(
+                str(successful_reads), "Successful Reads", allure.attachment_type.TEXT
+            )
+
+    @allure.story("Concurrency Support")
+    @allure.title("Concurrent cache writes are batched into one worker-thread hop")
+    @allure.description(
+        "Tests that concurrent set calls issued together are coalesced into a single batch "
+        "instead of each paying for a slow write of its own"
+    )
+    @allure.severity(allure.severity_level.CRITICAL)
+    @allure.tag("cache", "concurrency", "async", "batching")
+    async def test_concurrent_cache_operations_is_actually_concurrent(
+        self, cache_manager: CacheManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that concurrent writes share batches where sequential writes cannot."""
+        delay, writes = 0.005, 50
+        original_write_files = manager._write_files
+        batch_sizes: list[int] = []
+
+        def slow_write_files(batch: list[tuple[Path, bytes]]) -> list[OSError | None]:
+            batch_sizes.append(len(batch))
+            time.sleep(delay)  # A slow disk, paid once per batch in the worker thread.
+            return original_write_files(batch)
+
+        monkeypatch.setattr(manager, "_write_files", slow_write_files)
+        analysis = _mk_commit(("Concurrent", "Tests"))
+
+        for i in range(writes):
+            await cache_manager.set_commit_analysis(f"sequential{i}", analysis)
+        # Each awaited write has the batch to itself.
+        assert batch_sizes == [1] * writes
+
+        batch_sizes.clear()
+        async with asyncio.TaskGroup() as group:
+            for i in range(writes):
+                group.create_task(cache_manager.set_commit_analysis(f"slow{i}", analysis))
+
+        assert sum(batch_sizes) == writes
+        assert len(batch_sizes) <= 2, f"{writes} concurrent writes took {batch_sizes} batches"
+        assert await cache_manager.get_commit_analysis(f"slow{writes - 1}") == analysis
+
+    async def test_batched_write_error_only_fails_its_writer(
+        self, cache_manager: CacheManager
+    ) -> None:
+        """Test that one failing file in a batch raises for its writer alone."""
+        analysis = _mk_commit(("Batched", "Tests"))
+
+        results = await asyncio.gather(
+            cache_manager.set_commit_analysis("batch-ok", analysis),
+            cache_manager.set_commit_analysis("no-such-dir/batch-bad", analysis),
+            return_exceptions=True,
+        )
+
+        assert results[0] is None
+        assert isinstance(results[1], FileNotFoundError)
+        assert await cache_manager.get_commit_analysis("batch-ok") == analysis
 
     @allure.story("Unicode Support")
     @allure.title("Cache and retrieve Unicode content correctly")
@@ -552,29 +640,29 @@ class TestCacheManager:
     )
     @allure.severity(allure.severity_level.NORMAL)
     @allure.tag("cache", "unicode", "internationalization", "encoding")
-    async def test_cache_with_unicode_content(self, cache_manager: CacheManager) -> None:
+    async def test_cache_with_unicode_content(
+        self, cache_manager: CacheManager, attach_if_verbose: Callable[..., None]
+    ) -> None:
         """Test caching content with unicode characters."""
         with allure.step("Set up analysis with Unicode content"):
-            analysis = CommitAnalysis(
-                changes=[
-                    Change(summary="Added 日本語 support", category="New Feature"),
-                    Change(summary="Fixed émoji 🚀 rendering", category="Bug Fix"),
-                ],
-                trivial=False,
+            analysis = _mk_commit(
+                ("Added 日本語 support", "New Feature"), ("Fixed émoji 🚀 rendering", "Bug Fix")
             )
             unicode_hash = "unicode123"
 
-            allure.attach(unicode_hash, "Unicode Commit Hash", allure.attachment_type.TEXT)
-            allure.attach(
-                analysis.changes[0].summary, "Japanese Text Summary", allure.attachment_type.TEXT
+            attach_if_verbose(unicode_hash, "Unicode Commit Hash", allure.attachment_type.TEXT)
+            attach_if_verbose(
+                analysis.changes[0].summary,
+                "Japanese Text Summary",
+                allure.attachment_type.TEXT,
             )
-            allure.attach(
+            attach_if_verbose(
                 analysis.changes[1].summary, "Emoji Text Summary", allure.attachment_type.TEXT
             )
 
         with allure.step("Store Unicode analysis in cache"):
             await cache_manager.set_commit_analysis(unicode_hash, analysis)
-            allure.attach(
+            attach_if_verbose(
                 "Unicode analysis cached successfully",
                 "Storage Status",
                 allure.attachment_type.TEXT,
@@ -582,49 +670,54 @@ class TestCacheManager:
 
         with allure.step("Retrieve Unicode analysis from cache"):
             retrieved = await cache_manager.get_commit_analysis(unicode_hash)
-            allure.attach(str(type(retrieved)), "Retrieved Type", allure.attachment_type.TEXT)
+            attach_if_verbose(str(type(retrieved)), "Retrieved Type", allure.attachment_type.TEXT)
 
         with allure.step("Verify Unicode content was preserved"):
-            check.is_not_none(retrieved)
-            check.equal(retrieved.changes[0].summary, "Added 日本語 support")  # type: ignore[union-attr]
-            check.equal(
-                retrieved.changes[1].summary,  # type: ignore[union-attr]
-                "Fixed émoji 🚀 rendering",
+            assert retrieved is not None
+            assert retrieved.changes[0].summary == "Added 日本語 support"
+            assert retrieved.changes[1].summary == "Fixed émoji 🚀 rendering"
+
+            # Stored as compact UTF-8, not \u-escaped, so it stays small and readable.
+            raw = (cache_manager._commits_path / f"{unicode_hash}.json").read_bytes()
+            assert "日本語".encode() in raw
+            assert len(raw) < 200
+
+            attach_if_verbose(
+                retrieved.changes[0].summary,
+                "Retrieved Japanese Text",
+                allure.attachment_type.TEXT,
+            )
+            attach_if_verbose(
+                retrieved.changes[1].summary,
+                "Retrieved Emoji Text",
+                allure.attachment_type.TEXT,
             )
-
-            if retrieved is not None:
-                allure.attach(
-                    retrieved.changes[0].summary,
-                    "Retrieved Japanese Text",
-                    allure.attachment_type.TEXT,
-                )
-                allure.attach(
-                    retrieved.changes[1].summary,
-                    "Retrieved Emoji Text",
-                    allure.attachment_type.TEXT,
-                )
 
     @allure.story("Hash Generation Edge Cases")
     @allure.title("Generate consistent hash for empty commit list")
     @allure.description("Tests that empty commit lists produce consistent and valid hashes")
     @allure.severity(allure.severity_level.NORMAL)
     @allure.tag("cache", "hashing", "edge-case", "empty-list")
-    async def test_empty_commit_list_hash(self, cache_manager: CacheManager) -> None:
+    async def test_empty_commit_list_hash(
+        self, cache_manager: CacheManager, attach_if_verbose: Callable[..., None]
+    ) -> None:
         """Test hash generation with empty commit list."""
         with allure.step("Generate hash for empty commit list"):
             empty_hash = cache_manager._get_hash([])
-            allure.attach(empty_hash, "Empty List Hash 1", allure.attachment_type.TEXT)
-            allure.attach(str(len(empty_hash)), "Hash Length", allure.attachment_type.TEXT)
+            attach_if_verbose(empty_hash, "Empty List Hash 1", allure.attachment_type.TEXT)
+            attach_if_verbose(str(len(empty_hash)), "Hash Length", allure.attachment_type.TEXT)
 
         with allure.step("Generate second hash for empty list to test consistency"):
             empty_hash2 = cache_manager._get_hash([])
-            allure.attach(empty_hash2, "Empty List Hash 2", allure.attachment_type.TEXT)
+            attach_if_verbose(empty_hash2, "Empty List Hash 2", allure.attachment_type.TEXT)
 
         with allure.step("Verify empty list hash properties"):
-            check.equal(len(empty_hash), 16)
+            assert len(empty_hash) == 16
             # Empty list should produce consistent hash
-            check.equal(empty_hash, empty_hash2)
+            assert empty_hash == empty_hash2
 
-            allure.attach(
-                str(empty_hash == empty_hash2), "Hashes Are Identical", allure.attachment_type.TEXT
+            attach_if_verbose(
+                str(empty_hash == empty_hash2),
+                "Hashes Are Identical",
+                allure.attachment_type.TEXT,
             )
@@ -6,18 +6,57 @@
 This module tests the git command execution utility.
 """
 
+from collections.abc import Iterator
+from pathlib import Path
 import subprocess
+import sys
+import threading
+from typing import Final
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import allure
+import git
 import pytest
 import pytest_check as check
 
+from git_ai_reporter.utils.git_command_runner import close_diff_batches
+from git_ai_reporter.utils.git_command_runner import fetch_commit_diff
 from git_ai_reporter.utils.git_command_runner import GitCommandError
+from git_ai_reporter.utils.git_command_runner import GitDiffTreeBatch
 from git_ai_reporter.utils.git_command_runner import run_git_command
 
 
+# A well-formed object name that no test repository contains.
+_MISSING_SHA: Final[str] = "0" * 39 + "1"
+
+
+@pytest.fixture
+def two_commit_repo(tmp_path: Path) -> tuple[str, str, str]:
+    """Create a real repository with two commits, returning (path, parent, commit)."""
+    repo = git.Repo.init(tmp_path)
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Test User")
+        writer.set_value("user", "email", "test@example.com")
+    (tmp_path / "a.txt").write_text("one\n", encoding="utf-8")
+    repo.index.add(["a.txt"])
+    parent = repo.index.commit("first").hexsha
+    (tmp_path / "a.txt").write_text("one\ntwo\n", encoding="utf-8")
+    (tmp_path / "b.txt").write_text("new\n", encoding="utf-8")
+    repo.index.add(["a.txt", "b.txt"])
+    commit = repo.index.commit("second").hexsha
+    return str(tmp_path), parent, commit
+
+
+@pytest.fixture
+def diff_batch(two_commit_repo: tuple[str, str, str]) -> Iterator[GitDiffTreeBatch]:
+    """Create a batch runner for the two-commit repository and stop it afterwards."""
+    # pylint: disable=redefined-outer-name
+    batch = GitDiffTreeBatch(two_commit_repo[0])
+    yield batch
+    batch.close()
+
+
 @allure.feature("Git Command Execution Utilities")
 class TestRunGitCommand:
     """Test suite for run_git_command function."""
@@ -619,3 +658,163 @@ class TestRunGitCommand:
                 "No Truncation Verification",
                 allure.attachment_type.TEXT,
             )
+
+
+@allure.feature("Git Command Execution Utilities")
+class TestGitDiffTreeBatch:
+    """Test suite for the long-running diff-tree batch runner."""
+
+    def test_fetch_matches_git_diff(
+        self,
+        two_commit_repo: tuple[str, str, str],  # pylint: disable=redefined-outer-name
+        diff_batch: GitDiffTreeBatch,  # pylint: disable=redefined-outer-name
+    ) -> None:
+        """Test that batched diffs are identical to `git diff parent commit`."""
+        repo_path, parent, commit = two_commit_repo
+        expected = run_git_command(repo_path, "diff", parent, commit, timeout=30)
+
+        first = diff_batch.fetch(parent, commit, timeout=30)
+        process = diff_batch._process  # pylint: disable=protected-access
+        second = diff_batch.fetch(parent, commit, timeout=30)
+
+        assert first == second == expected
+        assert "+two" in first and "b.txt" in first
+        # The same subprocess served both requests.
+        assert diff_batch._process is process  # pylint: disable=protected-access
+
+    def test_fetch_restarts_after_process_exit(
+        self,
+        two_commit_repo: tuple[str, str, str],  # pylint: disable=redefined-outer-name
+        diff_batch: GitDiffTreeBatch,  # pylint: disable=redefined-outer-name
+    ) -> None:
+        """Test that a dead subprocess raises once and is then replaced."""
+        _, parent, commit = two_commit_repo
+        diff_batch.fetch(parent, commit, timeout=30)
+        process = diff_batch._process  # pylint: disable=protected-access
+        assert process is not None
+        process.kill()
+        process.wait()
+
+        assert diff_batch.fetch(parent, commit, timeout=30)
+        assert diff_batch._process is not process  # pylint: disable=protected-access
+        # The dead process's pipes were closed before it was replaced.
+        assert process.stdin is not None and process.stdin.closed
+        assert process.stdout is not None and process.stdout.closed
+
+    def test_fetch_eof_raises(self, diff_batch: GitDiffTreeBatch) -> None:
+        """Test that output ending before the end marker raises GitCommandError."""
+        # pylint: disable=redefined-outer-name
+        with patch.object(diff_batch, "_start") as mock_start:
+            mock_start.return_value.stdout.readline.return_value = ""
+            with pytest.raises(GitCommandError, match="Git diff-tree failed"):
+                diff_batch.fetch("parent", "commit", timeout=30)
+
+    def test_fetch_missing_commit_raises(
+        self,
+        two_commit_repo: tuple[str, str, str],  # pylint: disable=redefined-outer-name
+        diff_batch: GitDiffTreeBatch,  # pylint: disable=redefined-outer-name
+    ) -> None:
+        """Test that a commit that does not exist raises git's error instead of diffing empty."""
+        _, parent, _ = two_commit_repo
+
+        with pytest.raises(GitCommandError, match="bad object"):
+            diff_batch.fetch(parent, _MISSING_SHA, timeout=30)
+
+    def test_fetch_missing_parent_raises_git_error(
+        self,
+        two_commit_repo: tuple[str, str, str],  # pylint: disable=redefined-outer-name
+        diff_batch: GitDiffTreeBatch,  # pylint: disable=redefined-outer-name
+    ) -> None:
+        """Test that a parent that kills diff-tree reports git's stderr, then recovers."""
+        _, parent, commit = two_commit_repo
+
+        with pytest.raises(GitCommandError, match=f"exit code 128.*{_MISSING_SHA}"):
+            diff_batch.fetch(_MISSING_SHA, commit, timeout=30)
+        assert diff_batch.fetch(parent, commit, timeout=30)
+
+    def test_fetch_watchdog_timeout_raises(self, diff_batch: GitDiffTreeBatch) -> None:
+        """Test that a request the subprocess never answers is killed and reported as a timeout."""
+        # pylint: disable=redefined-outer-name,protected-access
+        diff_batch._command = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+        with pytest.raises(GitCommandError, match="timed out after 1 seconds"):
+            diff_batch.fetch("parent", "commit", timeout=1)
+        assert diff_batch._process is None
+
+    def test_fetch_reuses_one_watchdog_thread(
+        self,
+        two_commit_repo: tuple[str, str, str],  # pylint: disable=redefined-outer-name
+        diff_batch: GitDiffTreeBatch,  # pylint: disable=redefined-outer-name
+    ) -> None:
+        """Test that requests share the subprocess's watchdog instead of each starting one."""
+        # pylint: disable=protected-access
+        _, parent, commit = two_commit_repo
+        diff_batch.fetch(parent, commit, timeout=30)
+        watchdog = diff_batch._watchdog_thread
+        threads = threading.active_count()
+
+        for _ in range(5):
+            diff_batch.fetch(parent, commit, timeout=30)
+
+        assert diff_batch._watchdog_thread is watchdog
+        assert threading.active_count() == threads
+        diff_batch.close()
+        assert watchdog is not None and not watchdog.is_alive()
+
+    def test_start_os_error(self, diff_batch: GitDiffTreeBatch) -> None:
+        """Test that failing to spawn git raises GitCommandError."""
+        # pylint: disable=redefined-outer-name
+        with patch("subprocess.Popen", side_effect=OSError("No such file")):
+            with pytest.raises(GitCommandError, match="Failed to execute git command"):
+                diff_batch.fetch("parent", "commit", timeout=30)
+
+    def test_fetch_commit_diff_reuses_batch_per_repo(
+        self,
+        two_commit_repo: tuple[str, str, str],  # pylint: disable=redefined-outer-name
+    ) -> None:
+        """Test that the module-level helper keeps one batch per repository."""
+        repo_path, parent, commit = two_commit_repo
+        try:
+            with patch(
+                "git_ai_reporter.utils.git_command_runner.GitDiffTreeBatch",
+                wraps=GitDiffTreeBatch,
+            ) as batch_cls:
+                first = fetch_commit_diff(repo_path, parent, commit, timeout=30)
+                second = fetch_commit_diff(repo_path, parent, commit, timeout=30)
+        finally:
+            close_diff_batches()
+
+        assert first == second
+        batch_cls.assert_called_once_with(repo_path)
+
+    def test_fetch_commit_diff_falls_back_when_pool_is_full(
+        self,
+        two_commit_repo: tuple[str, str, str],  # pylint: disable=redefined-outer-name
+    ) -> None:
+        """Test that a caller finding every allowed batch busy runs a one-off `git diff`."""
+        repo_path, parent, commit = two_commit_repo
+        nested: list[str] = []
+        original_fetch = GitDiffTreeBatch.fetch
+
+        def fetch_while_checked_out(
+            batch: GitDiffTreeBatch, *args: str, **kwargs: bool | int
+        ) -> str:
+            # The only allowed batch is checked out here, so this call cannot get one.
+            nested.append(fetch_commit_diff(repo_path, parent, commit, timeout=30))
+            return original_fetch(batch, *args, **kwargs)  # type: ignore[arg-type]
+
+        try:
+            with (
+                patch("os.cpu_count", return_value=1),
+                patch.object(GitDiffTreeBatch, "fetch", fetch_while_checked_out),
+                patch(
+                    "git_ai_reporter.utils.git_command_runner.run_git_command",
+                    wraps=run_git_command,
+                ) as run_cmd,
+            ):
+                outer = fetch_commit_diff(repo_path, parent, commit, timeout=30)
+        finally:
+            close_diff_batches()
+
+        assert nested == [outer]
+        run_cmd.assert_called_once_with(repo_path, "diff", parent, commit, timeout=30, debug=False)
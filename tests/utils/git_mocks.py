@@ -0,0 +1,12 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025 Blackcat Informatics® Inc.
+
+"""Shared helpers for tests that mock GitPython objects."""
+
+from typing import Final
+
+import git
+
+# Attribute names of git.Commit, computed once. Speccing mocks from this list keeps attribute
+# checking but skips the per-mock introspection of git.Commit that spec=git.Commit performs.
+COMMIT_SPEC: Final[list[str]] = dir(git.Commit)